@@ -9,19 +9,30 @@ is enabled, and if so, runs the extraction process.
 import os
 import sys
 import configparser
-from pathlib import Path
+import logging
 
 # Add the parent directory to the path
 script_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.abspath(os.path.join(script_dir, '..'))
 sys.path.insert(0, project_root)
 
+from src.utils.cache import ensure_dir
 from src.utils.config import load_config
-from src.api.extract_endpoints import extract_endpoints_from_file, group_endpoints_by_prefix, save_endpoints
+from src.api.extract_endpoints import (
+    ENDPOINT_EXTENSIONS, extract_endpoints_from_files, save_endpoints,
+    load_endpoint_cache, save_endpoint_cache
+)
+
+logger = logging.getLogger(__name__)
 
 
 def check_endpoint_extraction():
-    """Check if endpoint extraction is enabled and run it if needed."""
+    """
+    Check if endpoint extraction is enabled.
+    
+    Returns:
+        tuple: (enabled, project_path, output_dir)
+    """
     print("Checking API endpoint extraction settings...")
     
     try:
@@ -31,13 +42,13 @@ def check_endpoint_extraction():
         # Check if endpoint extraction is enabled
         if not config['api_settings'].getboolean('extract_endpoints', False):
             print("API endpoint extraction is disabled.")
-            return False
+            return False, None, None
         
         # Get project path
         project_path = config['settings'].get('path')
         if not project_path:
             print("Project path not specified.")
-            return False
+            return False, None, None
         
         # Get output directory
         output_dir = config['settings'].get('output_dir', 'output')
@@ -46,11 +57,66 @@ def check_endpoint_extraction():
         print(f"Project path: {project_path}")
         print(f"Output directory: {output_dir}")
         
-        return True
+        return True, project_path, output_dir
     
     except Exception as e:
         print(f"Error checking endpoint extraction: {e}")
-        return False
+        return False, None, None
+
+
+def _iter_source_files(root, extensions):
+    """
+    Recursively yield paths of files under root with a relevant extension.
+    
+    Uses os.scandir so file type checks reuse the directory entry
+    information instead of issuing an extra stat call per entry. Like
+    os.walk, symlinked files are included but symlinked directories are
+    not descended into.
+    
+    Args:
+        root (str): Directory to walk
+        extensions (frozenset): Lowercase file extensions to include
+        
+    Yields:
+        str: Path to a matching file
+    """
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_source_files(entry.path, extensions)
+                elif entry.is_file():
+                    if os.path.splitext(entry.name)[1].lower() in extensions:
+                        yield entry.path
+    except OSError as e:
+        print(f"Error reading directory {root}: {e}")
+
+
+def _collect_results(results, endpoints):
+    """
+    Gather per-file extraction results into the endpoints set.
+    
+    Args:
+        results (iterable): (file_path, endpoints, error) tuples
+        endpoints (set): Set to update with the found endpoints
+        
+    Returns:
+        tuple: (files with endpoints, total endpoints found across files)
+    """
+    files_with_endpoints = 0
+    total_matches = 0
+    
+    for file_path, file_endpoints, error in results:
+        if error:
+            logger.warning("Error extracting endpoints from %s: %s", file_path, error)
+        elif file_endpoints:
+            # Per-file detail goes to the debug log; a summary is printed at the end
+            logger.debug("Found %d endpoints in %s", len(file_endpoints), file_path)
+            files_with_endpoints += 1
+            total_matches += len(file_endpoints)
+            endpoints.update(file_endpoints)
+    
+    return files_with_endpoints, total_matches
 
 
 def extract_endpoints(project_path, output_dir):
@@ -66,56 +132,40 @@ def extract_endpoints(project_path, output_dir):
     # Get project name from path
     project_name = os.path.basename(os.path.normpath(project_path))
     
-    # Create output directory for this project
+    # Create output directory (and its parents) for this project
     output_path = os.path.join(output_dir, project_name)
-    Path(output_path).mkdir(exist_ok=True)
-    
-    endpoints = []
-    
-    # Walk through project files
-    for root, _, files in os.walk(project_path):
-        for file in files:
-            file_path = os.path.join(root, file)
-            
-            # Skip binary files and non-relevant extensions
-            ext = os.path.splitext(file)[1].lower()
-            if ext in ['.py', '.js', '.ts', '.java', '.rb', '.php', '.go', '.yaml', '.yml', '.json']:
-                try:
-                    file_endpoints = extract_endpoints_from_file(file_path)
-                    if file_endpoints:
-                        print(f"Found {len(file_endpoints)} endpoints in {file_path}")
-                        endpoints.extend(file_endpoints)
-                except Exception as e:
-                    print(f"Error extracting endpoints from {file_path}: {e}")
-    
-    # Remove duplicates
-    unique_endpoints = list(set(endpoints))
-    print(f"Found {len(unique_endpoints)} unique endpoints.")
-    
-    # Group endpoints by prefix
-    grouped_endpoints = group_endpoints_by_prefix(unique_endpoints)
-    
-    # Save endpoints
-    endpoints_path = os.path.join(output_path, f"{project_name}_endpoints.json")
+    ensure_dir(output_path)
+    
+    # Deduplicate as results come in rather than in one pass at the end
+    endpoints = set()
+    
+    # Reuse results for files that have not changed since the last run
+    cache = load_endpoint_cache(output_dir)
+    
+    # Collect relevant project files first so the work can be split up
+    file_paths = list(_iter_source_files(project_path, ENDPOINT_EXTENSIONS))
+    
+    results = extract_endpoints_from_files(file_paths, cache=cache)
+    files_with_endpoints, total_matches = _collect_results(results, endpoints)
     
-    # Save endpoints to JSON file
-    with open(endpoints_path, 'w', encoding='utf-8') as f:
-        import json
-        json.dump(grouped_endpoints, f, indent=2)
+    save_endpoint_cache(output_dir, cache)
+    
+    print(f"Scanned {len(file_paths)} files: {total_matches} endpoints in "
+          f"{files_with_endpoints} files, {len(endpoints)} unique.")
+    
+    # Group endpoints by prefix and save them to a JSON file
+    endpoints_path = os.path.join(output_path, f"{project_name}_endpoints.json")
+    save_endpoints(sorted(endpoints), endpoints_path)
     
     print(f"Saved endpoints to {endpoints_path}")
 
 
 def main():
     """Main function."""
-    if check_endpoint_extraction():
-        config = load_config()
-        project_path = config['settings'].get('path')
-        output_dir = config['settings'].get('output_dir', 'output')
-        
-        # Create output directory if it doesn't exist
-        Path(output_dir).mkdir(exist_ok=True)
-        
+    # Reuse the settings read during the check instead of loading the config again
+    enabled, project_path, output_dir = check_endpoint_extraction()
+    
+    if enabled:
         # Extract endpoints
         extract_endpoints(project_path, output_dir)
         return 0
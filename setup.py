@@ -11,6 +11,8 @@ setup(
     ],
     extras_require={
         "token_counting": ["tiktoken>=0.3.0"],
+        "fast_json": ["orjson>=3.6"],
+        "fast_matching": ["pyahocorasick>=2.0"],
         "api_extraction": ["PyYAML>=6.0"],
         "dev": [
             "pytest>=7.0.0",
@@ -19,6 +21,8 @@ setup(
         "all": [
             "tiktoken>=0.3.0",
             "PyYAML>=6.0",
+            "orjson>=3.6",
+            "pyahocorasick>=2.0",
         ],
     },
 )
\ No newline at end of file
@@ -6,27 +6,409 @@ import os
 import re
 import json
 import ast
+import mmap
+import hashlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+from src.utils.cache import ensure_dir, load_cache, save_cache
 
-def extract_endpoints_from_file(file_path, file_content=None):
+# orjson is optional; it serializes the endpoints file much faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Files larger than this are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 64 * 1024
+
+# Larger files (generated bundles, minified assets, data dumps) are not scanned
+MAX_SCAN_BYTES = 2 * 1024 * 1024
+
+# A NUL byte within this many leading bytes marks a file as binary
+BINARY_PROBE_BYTES = 4096
+
+# Name of the endpoint cache file kept in the output directory
+ENDPOINT_CACHE_FILENAME = '.endpoint_cache.json'
+
+# File extensions that may contain API endpoints
+ENDPOINT_EXTENSIONS = frozenset({'.py', '.js', '.ts', '.java', '.rb', '.php', '.go', '.yaml', '.yml', '.json'})
+
+# Below this many files the process pool startup costs more than it saves
+PARALLEL_THRESHOLD = 100
+
+# Endpoint cache used by _extract_in_worker (a private copy in each worker process)
+_worker_cache = None
+
+
+# Flask route decorators
+_FLASK_PATTERN = re.compile(rb"""
+    (?:
+        @[\w.]+\.(?:route|get|post|put|delete|patch|options|head)\(
+                                         # app/blueprint/Flask-RESTX routes,
+                                         # including HTTP method-specific ones
+      | api\.add_resource\([^,]+,\s*     # Flask-RESTful resources
+    )
+    [\'"]([^\'"]+)[\'"]
+""", re.VERBOSE)
+_FLASK_TOKENS = (b'.route(', b'.get(', b'.post(', b'.put(', b'.delete(', b'.patch(',
+                 b'.options(', b'.head(', b'add_resource(')
+
+# FastAPI routes and Django URL patterns
+_PYTHON_PATTERN = re.compile(rb"""
+    @(?:app|router)\.(?:get|post|put|delete|patch|head|options)\([\'"]([^\'"]+)[\'"]  # FastAPI
+  | path\([\'"]([^\'"]+)[\'"]                    # Django path()
+  | url\([\'"](?:\^)?([^\'"^$]+)[\'"]             # Django url()
+""", re.VERBOSE)
+_PYTHON_TOKENS = (b'@app.', b'@router.', b'path(', b'url(')
+
+# Express.js routes, React Router routes and Axios/fetch calls
+_JAVASCRIPT_PATTERN = re.compile(rb"""
+    (?:
+        (?:app|router)\.(?:get|post|put|delete|patch)\(   # Express.js
+      | route\(
+      | <Route(?:\s+[^>]*)?path=                         # React Router
+    )
+    [\'"]([^\'"]+)[\'"]
+  | (?:(?:axios|fetch)\(|url:\s*)                        # Axios or fetch calls
+    [\'"](?:https?://[^/]+)?(/[^\'"]+)[\'"]
+""", re.VERBOSE)
+_JAVASCRIPT_TOKENS = (b'app.', b'router.', b'route(', b'<Route', b'axios(', b'fetch(', b'url:')
+
+# Spring and JAX-RS annotations
+_JAVA_PATTERN = re.compile(
+    rb'@(?:RequestMapping|GetMapping|PostMapping|PutMapping|DeleteMapping|PatchMapping|Path)'
+    rb'\([\'"]([^\'"]+)[\'"]'
+)
+_JAVA_TOKENS = (b'Mapping(', b'@Path(')
+
+# Rails routes
+_RUBY_PATTERN = re.compile(rb'(?:get|post|put|patch|delete|match)\s+[\'"]([^\'"]+)[\'"]')
+_RUBY_TOKENS = (b'get', b'post', b'put', b'patch', b'delete', b'match')
+
+# Laravel/Symfony routes
+_PHP_PATTERN = re.compile(rb'(?:Route::(?:get|post|put|patch|delete)\(|->add\()[\'"]([^\'"]+)[\'"]')
+_PHP_TOKENS = (b'Route::', b'->add(')
+
+# Gin/Echo/Gorilla/Net/HTTP patterns
+_GO_PATTERN = re.compile(
+    rb'(?:(?:r|router|e|mux)\.(?:GET|POST|PUT|DELETE|PATCH|Handle(?:Func)?)\(|http\.Handle(?:Func)?\()'
+    rb'[\'"]([^\'"]+)[\'"]'
+)
+_GO_TOKENS = (b'.GET(', b'.POST(', b'.PUT(', b'.DELETE(', b'.PATCH(', b'.Handle')
+
+# Any decorator call that may register a route, used to gate the AST fallback
+_ROUTE_DECORATOR_HINT = re.compile(rb'@[\w.]+\.(?:route|get|post|put|delete|patch)\(')
+
+# Endpoint path without surrounding slashes or query string
+_CLEAN_PATTERN = re.compile(r'/*([^?]*?)/*(?:\?.*)?\Z', re.DOTALL)
+
+# Decorator attributes that register a Flask route
+_ROUTE_ATTRS = frozenset({'route', 'get', 'post', 'put', 'delete', 'patch'})
+
+# AST fields holding nested statement blocks (or except handlers/match cases)
+_STATEMENT_BLOCK_FIELDS = ('body', 'orelse', 'handlers', 'finalbody', 'cases')
+
+# Generic API URL patterns
+_URL_PATTERN = re.compile(rb'(?:https?://[^/\s]+)?(/(?:api|v\d+|rest)/[^\s\'"]+)[\'"]?')
+_URL_TOKENS = (b'/api/', b'/v', b'/rest/')
+
+# Literals at least one of which a file must contain for its extractor to find
+# anything; the Flask tokens also cover decorators handled by the AST fallback
+_PYTHON_ANCHORS = _FLASK_TOKENS + _PYTHON_TOKENS
+_JAVASCRIPT_ANCHORS = _JAVASCRIPT_TOKENS
+_JAVA_ANCHORS = _JAVA_TOKENS
+_SPEC_ANCHORS = (b'paths',) + _URL_TOKENS
+_LANG_ANCHORS = {
+    '.py': _PYTHON_ANCHORS, '.flask': _PYTHON_ANCHORS,
+    '.js': _JAVASCRIPT_ANCHORS, '.ts': _JAVASCRIPT_ANCHORS,
+    '.jsx': _JAVASCRIPT_ANCHORS, '.tsx': _JAVASCRIPT_ANCHORS,
+    '.java': _JAVA_ANCHORS, '.kt': _JAVA_ANCHORS, '.scala': _JAVA_ANCHORS,
+    '.rb': _RUBY_TOKENS,
+    '.php': _PHP_TOKENS,
+    '.go': _GO_TOKENS,
+    '.yaml': _SPEC_ANCHORS, '.yml': _SPEC_ANCHORS, '.json': _SPEC_ANCHORS,
+}
+
+# Cache key recorded for files without any anchor, so they are never hashed
+_NO_ANCHOR_KEY = ''
+
+
+def _contains_any(content, tokens):
+    """
+    Cheap substring check run before a regex scan.
+    
+    Every token is a literal that any match of the corresponding pattern
+    must contain, so a file without any of them cannot produce endpoints.
+    ``find`` is used rather than ``in`` so the check also works on mmaps.
+    """
+    return any(content.find(token) != -1 for token in tokens)
+
+
+def _find_all(pattern, content):
+    """
+    Return the captured endpoint of every match of a multi-group pattern.
+    
+    Only one alternative can match at a time, so the last matched group
+    is the one holding the endpoint.
+    """
+    return [match.group(match.lastindex) for match in pattern.finditer(content)]
+
+
+def _cache_version():
+    """
+    Fingerprint this module's source so cached results are dropped whenever
+    the extraction patterns or logic change.
+    """
+    with open(__file__, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def load_endpoint_cache(output_dir):
+    """
+    Load the persistent endpoint cache from the output directory.
+    
+    The cache maps content hashes to extracted endpoints, with a per-path
+    (mtime, size, hash) record that lets unchanged files skip both reading
+    and hashing on later runs.
+    
+    Args:
+        output_dir (str): Output directory path
+        
+    Returns:
+        dict: Endpoint cache
+    """
+    cache = load_cache(os.path.join(output_dir, ENDPOINT_CACHE_FILENAME))
+    version = _cache_version()
+    
+    if cache.get('version') != version:
+        cache = {'version': version, 'files': {}, 'hashes': {}}
+    
+    return cache
+
+
+def save_endpoint_cache(output_dir, cache):
+    """
+    Save the endpoint cache to the output directory.
+    
+    Results for content no longer referenced by any file are dropped.
+    
+    Args:
+        output_dir (str): Output directory path
+        cache (dict): Endpoint cache
+    """
+    hashes = cache['hashes']
+    referenced = {record[2] for record in cache['files'].values()}
+    cache['hashes'] = {key: hashes[key] for key in referenced if key in hashes}
+    
+    save_cache(os.path.join(output_dir, ENDPOINT_CACHE_FILENAME), cache)
+
+
+def get_cache_entry(cache, file_path):
+    """
+    Get the cached record for a file, e.g. to send it back from a worker process.
+    
+    Args:
+        cache (dict): Endpoint cache
+        file_path (str): Path to the file
+        
+    Returns:
+        tuple: (abs_path, record, endpoints) or None if the file is not cached
+    """
+    abs_path = os.path.abspath(file_path)
+    record = cache['files'].get(abs_path)
+    
+    if record is None or record[2] not in cache['hashes']:
+        return None
+    
+    return abs_path, record, cache['hashes'][record[2]]
+
+
+def merge_cache_entry(cache, entry):
+    """
+    Add a record returned by get_cache_entry to a cache.
+    
+    Args:
+        cache (dict): Endpoint cache
+        entry (tuple): (abs_path, record, endpoints)
+    """
+    abs_path, record, endpoints = entry
+    cache['files'][abs_path] = record
+    cache['hashes'][record[2]] = endpoints
+
+
+def _init_worker_cache(cache):
+    """
+    Set the endpoint cache used by _extract_in_worker.
+    
+    Args:
+        cache (dict): Endpoint cache, or None to disable caching
+    """
+    global _worker_cache
+    _worker_cache = cache
+
+
+def _extract_in_worker(file_path):
+    """
+    Extract endpoints from a single file, capturing any error.
+    
+    Module-level so it can be pickled and run in worker processes.
+    
+    Args:
+        file_path (str): Path to the file
+        
+    Returns:
+        tuple: (file_path, set of endpoints, error message or None, cache entry or None)
+    """
+    try:
+        file_endpoints = extract_endpoints_from_file(file_path, cache=_worker_cache)
+    except Exception as e:
+        return file_path, set(), str(e), None
+    
+    cache_entry = get_cache_entry(_worker_cache, file_path) if _worker_cache is not None else None
+    return file_path, file_endpoints, None, cache_entry
+
+
+def extract_endpoints_from_files(file_paths, cache=None):
+    """
+    Extract API endpoints from many files.
+    
+    The regex work is CPU-bound, so from PARALLEL_THRESHOLD files on it is
+    spread over worker processes. Each worker gets a copy of the cache, and
+    the records it adds are merged back into cache as its results arrive.
+    
+    Args:
+        file_paths (list): Paths to the files
+        cache (dict, optional): Endpoint cache from load_endpoint_cache
+        
+    Yields:
+        tuple: (file_path, set of endpoints, error message or None), in file_paths order
+    """
+    if len(file_paths) < PARALLEL_THRESHOLD:
+        _init_worker_cache(cache)
+        try:
+            for file_path, file_endpoints, error, _ in map(_extract_in_worker, file_paths):
+                yield file_path, file_endpoints, error
+        finally:
+            _init_worker_cache(None)
+        return
+    
+    with ProcessPoolExecutor(initializer=_init_worker_cache, initargs=(cache,)) as executor:
+        for file_path, file_endpoints, error, cache_entry in executor.map(
+                _extract_in_worker, file_paths, chunksize=64):
+            if cache_entry:
+                merge_cache_entry(cache, cache_entry)
+            yield file_path, file_endpoints, error
+
+
+def extract_endpoints_from_file(file_path, file_content=None, cache=None):
     """
     Extract API endpoints from a file based on its extension.
     
     Args:
         file_path (str): Path to the file
-        file_content (str, optional): File content if already loaded
+        file_content (str or bytes, optional): File content if already loaded
+        cache (dict, optional): Endpoint cache from load_endpoint_cache
         
     Returns:
-        list: List of extracted endpoints
+        set: Extracted endpoints
     """
+    stat = None
+    if cache is not None:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return set()
+        
+        # Same path, mtime and size as last time: skip reading and hashing
+        record = cache['files'].get(os.path.abspath(file_path))
+        if (record and record[0] == stat.st_mtime_ns and record[1] == stat.st_size
+                and record[2] in cache['hashes']):
+            return set(cache['hashes'][record[2]])
+    
     if file_content is None:
+        # Read raw bytes; the patterns match bytes and only the captured
+        # endpoints are decoded, so there is no full-file decode step
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                file_content = f.read()
-        except (UnicodeDecodeError, IOError):
-            return []
+            with open(file_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size > MAX_SCAN_BYTES:
+                    return set()
+                
+                # Let the regex engine scan large files straight from the page cache
+                if size > MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        if b'\x00' in mapped[:BINARY_PROBE_BYTES]:
+                            return set()
+                        return _extract_with_cache(file_path, mapped, cache, stat)
+                
+                head = f.read(BINARY_PROBE_BYTES)
+                if b'\x00' in head:
+                    return set()
+                file_content = head + f.read()
+        except (IOError, ValueError):
+            return set()
+    else:
+        if isinstance(file_content, str):
+            file_content = file_content.encode('utf-8')
+        
+        if len(file_content) > MAX_SCAN_BYTES or b'\x00' in file_content[:BINARY_PROBE_BYTES]:
+            return set()
+    
+    return _extract_with_cache(file_path, file_content, cache, stat)
+
+
+def _extract_with_cache(file_path, file_content, cache, stat):
+    """
+    Extract endpoints from loaded content, reusing cached results by content hash.
+    
+    Args:
+        file_path (str): Path to the file
+        file_content (bytes or mmap.mmap): File content
+        cache (dict): Endpoint cache, or None to disable caching
+        stat (os.stat_result): Stat of the file when caching
+        
+    Returns:
+        set: Extracted endpoints
+    """
+    # Most source files contain no anchor at all; skip hashing and dispatch for them
+    anchors = _LANG_ANCHORS.get(os.path.splitext(file_path)[1].lower(), _URL_TOKENS)
+    has_anchor = _contains_any(file_content, anchors)
+    
+    if cache is None:
+        return _extract_from_content(file_path, file_content) if has_anchor else set()
+    
+    if not has_anchor:
+        cache['hashes'][_NO_ANCHOR_KEY] = []
+        cache['files'][os.path.abspath(file_path)] = [stat.st_mtime_ns, stat.st_size, _NO_ANCHOR_KEY]
+        return set()
+    
+    content_hash = hashlib.blake2b(file_content, digest_size=16).hexdigest()
+    endpoints = cache['hashes'].get(content_hash)
+    
+    if endpoints is None:
+        endpoints = _extract_from_content(file_path, file_content)
+        cache['hashes'][content_hash] = sorted(endpoints)
     
+    cache['files'][os.path.abspath(file_path)] = [stat.st_mtime_ns, stat.st_size, content_hash]
+    
+    return set(endpoints)
+
+
+def _extract_from_content(file_path, file_content):
+    """
+    Dispatch loaded file content to the extractor for its file type.
+    
+    Args:
+        file_path (str): Path to the file
+        file_content (bytes or mmap.mmap): File content
+        
+    Returns:
+        set: Extracted endpoints
+    """
     file_ext = os.path.splitext(file_path)[1].lower()
     
     # Extract based on file extension
@@ -62,43 +444,57 @@ def extract_from_flask(content):
     Extract Flask API endpoints using enhanced detection methods.
     
     Args:
-        content (str): Python file content
+        content (bytes): Python file content
         
     Returns:
-        list: List of extracted Flask endpoints
+        set: Extracted Flask endpoints
     """
     endpoints = []
     
-    # Pattern 1: Flask route decorators
-    flask_patterns = [
-        # Standard Flask routes
-        r'@(?:app|blueprint|api)\.route\([\'"]([^\'"]+)[\'"]',
-        # HTTP method-specific routes
-        r'@(?:app|blueprint|api)\.(?:get|post|put|delete|patch|options|head)\([\'"]([^\'"]+)[\'"]',
-        # Flask-RESTful resource endpoints
-        r'api\.add_resource\([^,]+,\s*[\'"]([^\'"]+)[\'"]',
-        # Blueprint routes
-        r'@(?:\w+)\.route\([\'"]([^\'"]+)[\'"]',
-        # Flask-RESTX endpoints
-        r'@(?:api\.route|ns\.route)\([\'"]([^\'"]+)[\'"]'
-    ]
-    
-    # Collect matches from all patterns
-    for pattern in flask_patterns:
-        matches = re.findall(pattern, content)
-        endpoints.extend(matches)
-    
-    # Try AST parsing for more accurate detection if not many endpoints found
-    if len(endpoints) < 5:  # Only try AST parsing if regex didn't find many routes
-        try:
-            ast_endpoints = extract_flask_endpoints_ast(content)
-            # Merge and remove duplicates
-            endpoints = list(set(endpoints + ast_endpoints))
-        except SyntaxError:
-            # If AST parsing fails, continue with regex results
-            pass
+    # Collect matches from all Flask route patterns in a single scan
+    if _contains_any(content, _FLASK_TOKENS):
+        endpoints = _FLASK_PATTERN.findall(content)
+    
+    # Fall back to AST parsing only when the regexes found nothing but the
+    # file still looks like it decorates views; parsing every Python file in
+    # a project is far more expensive than this check
+    if not endpoints and _ROUTE_DECORATOR_HINT.search(content):
+        endpoints = extract_flask_endpoints_ast(content)
+    
+    return set(filter(None, map(clean_endpoint, set(endpoints))))
+
+
+def _scan_route_decorators(nodes, endpoints):
+    """
+    Collect route paths from decorated functions among the given statements.
+    
+    Every statement block is descended into (function and class bodies, if/else
+    branches, try/except/finally and with/for/while/match blocks), but
+    expression subtrees (the bulk of a module's AST) are never visited.
     
-    return [clean_endpoint(endpoint) for endpoint in endpoints]
+    Args:
+        nodes (list): AST statement nodes
+        endpoints (list): List to append the found endpoints to
+    """
+    for node in nodes:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            for decorator in node.decorator_list:
+                # Check for app.route() or similar patterns with a literal path
+                if (isinstance(decorator, ast.Call)
+                        and isinstance(decorator.func, ast.Attribute)
+                        and decorator.func.attr in _ROUTE_ATTRS
+                        and decorator.args
+                        and isinstance(decorator.args[0], ast.Constant)
+                        and isinstance(decorator.args[0].value, str)):
+                    endpoints.append(decorator.args[0].value)
+        
+        # Nested blocks, e.g. routes registered inside an application factory
+        # or under an ``if``/``try``; except handlers and match cases are not
+        # statements themselves but carry a body of their own
+        for field in _STATEMENT_BLOCK_FIELDS:
+            block = getattr(node, field, None)
+            if block:
+                _scan_route_decorators(block, endpoints)
 
 
 def extract_flask_endpoints_ast(content):
@@ -106,7 +502,7 @@ def extract_flask_endpoints_ast(content):
     Extract Flask endpoints using AST parsing for more accurate results.
     
     Args:
-        content (str): Python file content
+        content (bytes): Python file content
         
     Returns:
         list: List of extracted endpoints
@@ -115,19 +511,11 @@ def extract_flask_endpoints_ast(content):
     
     try:
         # Parse the Python code
-        tree = ast.parse(content)
+        # The parser needs a real bytes object (a no-op unless content is an mmap)
+        tree = ast.parse(bytes(content))
         
         # Look for route decorators
-        for node in ast.walk(tree):
-            # Find function definitions
-            if isinstance(node, ast.FunctionDef):
-                for decorator in node.decorator_list:
-                    # Check for app.route() or similar patterns
-                    if isinstance(decorator, ast.Call):
-                        if hasattr(decorator.func, 'attr') and decorator.func.attr in ['route', 'get', 'post', 'put', 'delete', 'patch']:
-                            # Get the route path from the first argument
-                            if decorator.args and isinstance(decorator.args[0], ast.Str):
-                                endpoints.append(decorator.args[0].s)
+        _scan_route_decorators(tree.body, endpoints)
     except Exception:
         # If AST parsing fails, return what we have
         pass
@@ -140,33 +528,17 @@ def extract_from_python(content):
     Extract API endpoints from Python code.
     
     Args:
-        content (str): Python file content
+        content (bytes): Python file content
         
     Returns:
-        list: List of extracted endpoints
+        set: Extracted endpoints
     """
-    endpoints = []
-    
-    # Flask routes (covered by extract_from_flask)
+    if not _contains_any(content, _PYTHON_TOKENS):
+        return set()
     
-    # FastAPI routes
-    fastapi_patterns = [
-        r'@(?:app|router)\.(?:get|post|put|delete|patch|head|options)\([\'"]([^\'"]+)[\'"]'
-    ]
+    endpoints = _find_all(_PYTHON_PATTERN, content)
     
-    # Django URL patterns
-    django_patterns = [
-        r'path\([\'"]([^\'"]+)[\'"]',
-        r'url\([\'"](?:\^)?([^\'"^$]+)[\'"]'
-    ]
-    
-    all_patterns = fastapi_patterns + django_patterns
-    
-    for pattern in all_patterns:
-        matches = re.findall(pattern, content)
-        endpoints.extend(matches)
-    
-    return [clean_endpoint(endpoint) for endpoint in endpoints]
+    return set(filter(None, map(clean_endpoint, set(endpoints))))
 
 
 def extract_from_javascript(content):
@@ -174,37 +546,17 @@ def extract_from_javascript(content):
     Extract API endpoints from JavaScript/TypeScript code.
     
     Args:
-        content (str): JavaScript file content
+        content (bytes): JavaScript file content
         
     Returns:
-        list: List of extracted endpoints
+        set: Extracted endpoints
     """
-    endpoints = []
-    
-    # Express.js routes
-    express_patterns = [
-        r'(?:app|router)\.(?:get|post|put|delete|patch)\([\'"]([^\'"]+)[\'"]',
-        r'route\([\'"]([^\'"]+)[\'"]'
-    ]
+    if not _contains_any(content, _JAVASCRIPT_TOKENS):
+        return set()
     
-    # React Router routes
-    react_patterns = [
-        r'<Route(?:\s+[^>]*)?path=[\'"]([^\'"]+)[\'"]'
-    ]
+    endpoints = _find_all(_JAVASCRIPT_PATTERN, content)
     
-    # Axios or fetch calls
-    http_patterns = [
-        r'(?:axios|fetch)\([\'"](?:https?://[^/]+)?(/[^\'"]+)[\'"]',
-        r'url:\s*[\'"](?:https?://[^/]+)?(/[^\'"]+)[\'"]'
-    ]
-    
-    all_patterns = express_patterns + react_patterns + http_patterns
-    
-    for pattern in all_patterns:
-        matches = re.findall(pattern, content)
-        endpoints.extend(matches)
-    
-    return [clean_endpoint(endpoint) for endpoint in endpoints]
+    return set(filter(None, map(clean_endpoint, set(endpoints))))
 
 
 def extract_from_java(content):
@@ -212,35 +564,17 @@ def extract_from_java(content):
     Extract API endpoints from Java/Kotlin/Scala code.
     
     Args:
-        content (str): Java file content
+        content (bytes): Java file content
         
     Returns:
-        list: List of extracted endpoints
+        set: Extracted endpoints
     """
-    endpoints = []
-    
-    # Spring annotations
-    spring_patterns = [
-        r'@RequestMapping\([\'"]([^\'"]+)[\'"]',
-        r'@GetMapping\([\'"]([^\'"]+)[\'"]',
-        r'@PostMapping\([\'"]([^\'"]+)[\'"]',
-        r'@PutMapping\([\'"]([^\'"]+)[\'"]',
-        r'@DeleteMapping\([\'"]([^\'"]+)[\'"]',
-        r'@PatchMapping\([\'"]([^\'"]+)[\'"]'
-    ]
+    if not _contains_any(content, _JAVA_TOKENS):
+        return set()
     
-    # JAX-RS annotations
-    jaxrs_patterns = [
-        r'@Path\([\'"]([^\'"]+)[\'"]'
-    ]
+    endpoints = _JAVA_PATTERN.findall(content)
     
-    all_patterns = spring_patterns + jaxrs_patterns
-    
-    for pattern in all_patterns:
-        matches = re.findall(pattern, content)
-        endpoints.extend(matches)
-    
-    return [clean_endpoint(endpoint) for endpoint in endpoints]
+    return set(filter(None, map(clean_endpoint, set(endpoints))))
 
 
 def extract_from_ruby(content):
@@ -248,24 +582,17 @@ def extract_from_ruby(content):
     Extract API endpoints from Ruby code.
     
     Args:
-        content (str): Ruby file content
+        content (bytes): Ruby file content
         
     Returns:
-        list: List of extracted endpoints
+        set: Extracted endpoints
     """
-    endpoints = []
-    
-    # Rails routes
-    rails_patterns = [
-        r'(?:get|post|put|patch|delete)\s+[\'"]([^\'"]+)[\'"]',
-        r'match\s+[\'"]([^\'"]+)[\'"]'
-    ]
+    if not _contains_any(content, _RUBY_TOKENS):
+        return set()
     
-    for pattern in rails_patterns:
-        matches = re.findall(pattern, content)
-        endpoints.extend(matches)
+    endpoints = _RUBY_PATTERN.findall(content)
     
-    return [clean_endpoint(endpoint) for endpoint in endpoints]
+    return set(filter(None, map(clean_endpoint, set(endpoints))))
 
 
 def extract_from_php(content):
@@ -273,24 +600,17 @@ def extract_from_php(content):
     Extract API endpoints from PHP code.
     
     Args:
-        content (str): PHP file content
+        content (bytes): PHP file content
         
     Returns:
-        list: List of extracted endpoints
+        set: Extracted endpoints
     """
-    endpoints = []
-    
-    # Laravel/Symfony routes
-    php_patterns = [
-        r'Route::(?:get|post|put|patch|delete)\([\'"]([^\'"]+)[\'"]',
-        r'->add\([\'"]([^\'"]+)[\'"]'
-    ]
+    if not _contains_any(content, _PHP_TOKENS):
+        return set()
     
-    for pattern in php_patterns:
-        matches = re.findall(pattern, content)
-        endpoints.extend(matches)
+    endpoints = _PHP_PATTERN.findall(content)
     
-    return [clean_endpoint(endpoint) for endpoint in endpoints]
+    return set(filter(None, map(clean_endpoint, set(endpoints))))
 
 
 def extract_from_go(content):
@@ -298,24 +618,35 @@ def extract_from_go(content):
     Extract API endpoints from Go code.
     
     Args:
-        content (str): Go file content
+        content (bytes): Go file content
         
     Returns:
-        list: List of extracted endpoints
+        set: Extracted endpoints
     """
-    endpoints = []
+    if not _contains_any(content, _GO_TOKENS):
+        return set()
+    
+    endpoints = _GO_PATTERN.findall(content)
     
-    # Gin/Echo/Gorilla/Net/HTTP patterns
-    go_patterns = [
-        r'(?:r|router|e|mux)\.(?:GET|POST|PUT|DELETE|PATCH|Handle(?:Func)?)\([\'"]([^\'"]+)[\'"]',
-        r'http\.Handle(?:Func)?\([\'"]([^\'"]+)[\'"]'
-    ]
+    return set(filter(None, map(clean_endpoint, set(endpoints))))
+
+
+@lru_cache(maxsize=None)
+def _get_yaml_loader():
+    """
+    Import PyYAML the first time a YAML specification is parsed.
     
-    for pattern in go_patterns:
-        matches = re.findall(pattern, content)
-        endpoints.extend(matches)
+    Returns:
+        callable: Function parsing YAML content, or None if PyYAML is not installed
+    """
+    try:
+        import yaml
+    except ImportError:
+        return None
     
-    return [clean_endpoint(endpoint) for endpoint in endpoints]
+    # libyaml's C loader is much faster on large specs when it is built in
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    return lambda content: yaml.load(content, Loader=loader)
 
 
 def extract_from_api_spec(file_path, content):
@@ -324,37 +655,37 @@ def extract_from_api_spec(file_path, content):
     
     Args:
         file_path (str): File path
-        content (str): File content
+        content (bytes): File content
         
     Returns:
-        list: List of extracted endpoints
+        set: Extracted endpoints
     """
     endpoints = []
     
+    # The parsers need a real bytes object (a no-op unless content is an mmap)
+    content = bytes(content)
+    
     if file_path.endswith(('.yaml', '.yml')):
+        load_yaml = _get_yaml_loader()
+        if load_yaml is None:
+            # If PyYAML is not available, fallback to regex extraction
+            return extract_generic_urls(content)
+        
         # Attempt to parse YAML
         try:
-            # Check if PyYAML is available
-            import importlib.util
-            spec = importlib.util.find_spec("yaml")
-            if spec is not None:
-                import yaml
-                data = yaml.safe_load(content)
-            else:
-                # If PyYAML is not available, fallback to regex extraction
-                return extract_generic_urls(content)
-        except (ImportError, Exception):
-            # Fallback to regex extraction if YAML parsing fails or if import fails
+            data = load_yaml(content)
+        except Exception:
+            # Fallback to regex extraction if YAML parsing fails
             return extract_generic_urls(content)
     elif file_path.endswith('.json'):
         # Attempt to parse JSON
         try:
             data = json.loads(content)
-        except json.JSONDecodeError:
-            # Fallback to regex extraction if JSON parsing fails
+        except ValueError:
+            # Fallback to regex extraction if JSON parsing (or decoding) fails
             return extract_generic_urls(content)
     else:
-        return []
+        return set()
     
     # Extract from OpenAPI/Swagger structure
     if data and isinstance(data, dict):
@@ -365,7 +696,7 @@ def extract_from_api_spec(file_path, content):
         elif 'swagger' in data and 'paths' in data:
             endpoints.extend(data['paths'].keys())
     
-    return [clean_endpoint(endpoint) for endpoint in endpoints]
+    return set(filter(None, map(clean_endpoint, set(endpoints))))
 
 
 def extract_generic_urls(content):
@@ -373,25 +704,17 @@ def extract_generic_urls(content):
     Extract potential API endpoints using generic URL patterns.
     
     Args:
-        content (str): File content
+        content (bytes): File content
         
     Returns:
-        list: List of extracted endpoints
+        set: Extracted endpoints
     """
-    endpoints = []
+    if not _contains_any(content, _URL_TOKENS):
+        return set()
     
-    # Generic API URL patterns
-    url_patterns = [
-        r'(?:https?://[^/\s]+)?(/api/[^\s\'"]+)[\'"]?',
-        r'(?:https?://[^/\s]+)?(/v\d+/[^\s\'"]+)[\'"]?',
-        r'(?:https?://[^/\s]+)?(/rest/[^\s\'"]+)[\'"]?'
-    ]
+    endpoints = _URL_PATTERN.findall(content)
     
-    for pattern in url_patterns:
-        matches = re.findall(pattern, content)
-        endpoints.extend(matches)
-    
-    return [clean_endpoint(endpoint) for endpoint in endpoints]
+    return set(filter(None, map(clean_endpoint, set(endpoints))))
 
 
 def clean_endpoint(endpoint):
@@ -399,22 +722,19 @@ def clean_endpoint(endpoint):
     Clean and normalize an API endpoint.
     
     Args:
-        endpoint (str): Raw endpoint
+        endpoint (str or bytes): Raw endpoint
         
     Returns:
         str: Cleaned endpoint
     """
-    # Remove query parameters
-    endpoint = endpoint.split('?')[0]
-    
-    # Remove trailing slashes
-    endpoint = endpoint.rstrip('/')
+    if isinstance(endpoint, bytes):
+        endpoint = endpoint.decode('utf-8', 'replace')
     
-    # Ensure leading slash
-    if endpoint and not endpoint.startswith('/'):
-        endpoint = '/' + endpoint
+    # Drop surrounding slashes and any query string in one match, then
+    # restore a single leading slash
+    path = _CLEAN_PATTERN.match(endpoint).group(1)
     
-    return endpoint
+    return '/' + path if path else ''
 
 
 def group_endpoints_by_prefix(endpoints):
@@ -422,39 +742,49 @@ def group_endpoints_by_prefix(endpoints):
     Group endpoints by common prefixes for better organization.
     
     Args:
-        endpoints (list): List of endpoints
+        endpoints (iterable): Endpoints to group
         
     Returns:
         dict: Grouped endpoints
     """
-    groups = {}
+    groups = defaultdict(list)
     
     for endpoint in endpoints:
-        parts = endpoint.strip('/').split('/')
+        # Only the first path segment is needed, so partition instead of split
+        prefix = endpoint.lstrip('/').partition('/')[0]
         
-        if len(parts) > 0:
-            prefix = parts[0]
-            if prefix not in groups:
-                groups[prefix] = []
+        if prefix:
             groups[prefix].append(endpoint)
     
-    return groups
+    return dict(groups)
 
 
-def save_endpoints(endpoints, output_path):
+def save_endpoints(endpoints, output_path, compact=False):
     """
     Save extracted endpoints to a file.
     
     Args:
-        endpoints (list): List of endpoints
+        endpoints (iterable): Endpoints to save
         output_path (str): Output file path
+        compact (bool): Write compact JSON for tooling instead of indented JSON
     """
     # Create output directory if it doesn't exist
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    ensure_dir(os.path.dirname(output_path))
     
     # Group endpoints by prefix
     grouped_endpoints = group_endpoints_by_prefix(endpoints)
     
-    # Save as JSON
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(grouped_endpoints, f, indent=2)
\ No newline at end of file
+    if orjson is not None:
+        # orjson encodes straight to UTF-8 bytes and is compact by default
+        option = 0 if compact else orjson.OPT_INDENT_2
+        Path(output_path).write_bytes(orjson.dumps(grouped_endpoints, option=option))
+        return
+    
+    # Encode in one call (json.dump issues a write per chunk) and keep
+    # non-ASCII characters as UTF-8 instead of escaping them
+    if compact:
+        data = json.dumps(grouped_endpoints, separators=(',', ':'), ensure_ascii=False)
+    else:
+        data = json.dumps(grouped_endpoints, indent=2, ensure_ascii=False)
+    
+    Path(output_path).write_text(data, encoding='utf-8')
\ No newline at end of file
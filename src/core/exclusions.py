@@ -0,0 +1,104 @@
+"""
+Shared exclusion rules for the structure and README generators.
+"""
+
+import re
+from functools import lru_cache
+
+# pyahocorasick is optional; it finds any of many substrings in one pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Default exclusions for the generated structure; names match anywhere in a path
+STRUCTURE_EXCLUDE_DIRS = (
+    # Python related
+    '__pycache__', '*.pyc', '*.pyo', '*.pyd', '*.so', '*.dll',
+    'venv', '.venv', 'env', '.env', 'virtualenv',
+    'dist', 'build', 'eggs', 'parts', 'bin', 'var',
+    'sdist', 'develop-eggs', '.installed.cfg', 'lib', 'lib64',
+    
+    # JavaScript/Node related
+    'node_modules', 'bower_components', '.npm', '.yarn',
+    
+    # Version control
+    '.git', '.hg', '.svn', '.cvs', '.bzr',
+    
+    # IDE and editors
+    '.idea', '.vscode', '*.swp', '*.swo', '*.swn', '*.bak',
+    
+    # OS specific
+    '.DS_Store', 'Thumbs.db', 'ehthumbs.db',
+    
+    # Project specific
+    'output', 'logs', 'temp', 'tmp', 'cache',
+    
+    # Package directories
+    'site-packages', '.pytest_cache'
+)
+
+# The README matches directory names with a trailing '/', so 'lib/' does not hide 'library.py'
+README_EXCLUDE_DIRS = tuple(
+    pattern if '*' in pattern or pattern == '.installed.cfg' else f"{pattern}/"
+    for pattern in STRUCTURE_EXCLUDE_DIRS
+)
+
+# Directories that are always left out, whatever the exclude patterns
+ALWAYS_EXCLUDE_DIRS = frozenset({
+    '__pycache__', 'venv', '.venv', 'node_modules', '.git',
+    'dist', 'build', 'eggs', 'site-packages'
+})
+
+# Compiled and binary file extensions that are always left out
+EXCLUDED_EXTENSIONS = frozenset({'.pyc', '.pyo', '.pyd', '.so', '.dll', '.exe'})
+
+
+@lru_cache(maxsize=8)
+def compile_exclude_patterns(exclude_dirs):
+    """
+    Build a matcher that finds any of the exclude patterns as a substring.
+    
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, so the cost
+    does not grow with the number of patterns, and a single alternation regex
+    otherwise. Patterns are plain substrings, not globs: '*.pyc' only matches a
+    literal '*.pyc'.
+    
+    Args:
+        exclude_dirs (tuple): Exclude patterns
+        
+    Returns:
+        callable: Function returning True if a string contains any pattern, or None if there are no patterns
+    """
+    if not exclude_dirs:
+        return None
+    
+    if '' in exclude_dirs:
+        # An empty pattern is a substring of everything
+        return lambda text: True
+    
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for pattern in exclude_dirs:
+            automaton.add_word(pattern, pattern)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    
+    regex = re.compile('|'.join(map(re.escape, exclude_dirs)))
+    return lambda text: regex.search(text) is not None
+
+
+def contains_excluded(text, exclude_dirs):
+    """
+    Check whether any exclude pattern occurs in a string.
+    
+    Args:
+        text (str): Name or path to check
+        exclude_dirs (list or tuple): Exclude patterns
+        
+    Returns:
+        bool: True if one of the patterns is a substring of text
+    """
+    matcher = compile_exclude_patterns(tuple(exclude_dirs))
+    return matcher is not None and matcher(text)
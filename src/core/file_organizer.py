@@ -6,10 +6,12 @@ maintain consistent project naming, and track excluded files.
 import os
 import shutil
 import datetime
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-import json
 
-from src.core.token_counter import estimate_file_tokens, estimate_structure_tokens
+from src.core.exclusions import STRUCTURE_EXCLUDE_DIRS, README_EXCLUDE_DIRS
+from src.core.token_counter import estimate_many_file_tokens, estimate_structure_tokens
 
 
 def get_file_content(file_path):
@@ -36,6 +38,35 @@ def get_file_content(file_path):
             return ""
 
 
+def _load_file_tokens(files_info, cached_files=None):
+    """
+    Add token counts to file information dictionaries.
+    
+    File content is not kept in memory; consumers read it from
+    file_info['abs_path'] when they need it.
+    
+    Args:
+        files_info (list): File information dictionaries, updated in place
+        cached_files (dict, optional): Scan cache entries by absolute path;
+            cached token counts are reused and new ones are recorded
+    """
+    uncached = []
+    for file_info in files_info:
+        entry = cached_files.get(file_info['abs_path']) if cached_files else None
+        if entry is not None and entry[3] is not None:
+            file_info['tokens'] = entry[3]
+        else:
+            uncached.append(file_info)
+    
+    token_counts = estimate_many_file_tokens([file_info['abs_path'] for file_info in uncached])
+    
+    for file_info in uncached:
+        file_info['tokens'] = token_counts[file_info['abs_path']]
+        entry = cached_files.get(file_info['abs_path']) if cached_files else None
+        if entry is not None:
+            entry[3] = file_info['tokens']
+
+
 def prioritize_files(files_info):
     """
     Sort files by importance and size.
@@ -63,6 +94,32 @@ def get_project_name(root_path):
     return os.path.basename(os.path.normpath(root_path))
 
 
+def _common_root(paths):
+    """
+    Find the deepest directory shared by all paths in a single pass.
+    
+    The candidate root is only shortened when a path falls outside it, so
+    most paths cost one prefix comparison.
+    
+    Args:
+        paths (iterable): Paths produced by the same directory walk
+        
+    Returns:
+        str: Longest common path, as os.path.commonpath would return it
+    """
+    paths = iter(paths)
+    root = next(paths)
+    
+    for path in paths:
+        while root and path != root and not path.startswith(root if root.endswith(os.sep) else root + os.sep):
+            parent = os.path.dirname(root)
+            if parent == root:
+                break
+            root = parent
+    
+    return os.path.normpath(root) if root else root
+
+
 def create_numbered_export_folder(output_dir, project_name):
     """
     Create a numbered export folder with project prefix.
@@ -83,20 +140,13 @@ def create_numbered_export_folder(output_dir, project_name):
     prefix = project_name[:5] if len(project_name) > 5 else project_name
     
     # Count existing export folders to get the next number
-    existing_folders = [f for f in os.listdir(project_dir) 
-                        if os.path.isdir(os.path.join(project_dir, f))]
     next_number = 1
-    if existing_folders:
-        folder_numbers = []
-        for folder in existing_folders:
-            try:
-                if '_' in folder:
-                    number = int(folder.split('_')[0])
-                    folder_numbers.append(number)
-            except ValueError:
-                continue
-        if folder_numbers:
-            next_number = max(folder_numbers) + 1
+    with os.scandir(project_dir) as entries:
+        folder_numbers = [int(entry.name.split('_', 1)[0]) for entry in entries
+                          if '_' in entry.name and entry.name.split('_', 1)[0].isdecimal()
+                          and entry.is_dir()]
+    if folder_numbers:
+        next_number = max(folder_numbers) + 1
     
     # Create the new folder
     export_folder_name = f"{next_number:03d}_{prefix}_{timestamp}"
@@ -122,13 +172,50 @@ def normalize_filename(path):
     return normalized
 
 
-def organize_files(files_info, max_tokens, generate_structure=True, generate_readme=True):
+def select_within_budget(tokens, budget):
+    """
+    Choose which files fit in the token budget.
+    
+    Files are taken in priority order. A file that would exceed the budget is
+    skipped, and the following (possibly smaller) files are still tried.
+    
+    Args:
+        tokens (list): Token count of each file, in priority order
+        budget (int): Number of tokens available for files
+        
+    Returns:
+        tuple: (list of booleans marking selected files, total tokens selected)
+    """
+    total = sum(tokens)
+    if total <= budget:
+        # Everything fits, no need to walk the files
+        return [True] * len(tokens), total
+    
+    selected = [False] * len(tokens)
+    smallest = min(tokens, default=0)
+    used = 0
+    for index, count in enumerate(tokens):
+        if used + count <= budget:
+            selected[index] = True
+            used += count
+        elif budget - used < smallest:
+            # Not even the smallest file fits any more; the rest stay excluded
+            break
+    
+    return selected, used
+
+
+def organize_files(files_info, max_tokens, generate_structure=True, generate_readme=True, cache=None):
     """
     Organize files based on importance and token count.
     
     Args:
         files_info (list): List of dictionaries with file information
         max_tokens (int): Maximum token limit
+        generate_structure (bool): Whether to generate the structure file
+        generate_readme (bool): Whether to generate a README
+        cache (dict, optional): Scan cache used by scan_directory, for reusing
+            token counts of unchanged files
         
     Returns:
         tuple: (list of organized files with token information, export folder path)
@@ -136,30 +223,25 @@ def organize_files(files_info, max_tokens, generate_structure=True, generate_rea
     # Prioritize files
     prioritized_files = prioritize_files(files_info)
     
-    # Calculate tokens for each file
-    for file_info in prioritized_files:
-        file_info['tokens'] = estimate_file_tokens(file_info['abs_path'])
-        file_info['content'] = get_file_content(file_info['abs_path'])
+    # Calculate tokens for each file; uncached files are counted in parallel
+    _load_file_tokens(prioritized_files, cache['files'] if cache is not None else None)
     
     # Estimate structure tokens
     structure_tokens = estimate_structure_tokens(prioritized_files)
     
     # Allocate tokens for files, respecting the maximum limit
+    tokens = [file_info['tokens'] for file_info in prioritized_files]
+    selected_mask, file_tokens = select_within_budget(tokens, max_tokens - structure_tokens)
+    current_tokens = structure_tokens + file_tokens  # Start with tokens for structure
+    
     selected_files = []
     excluded_files = []  # Track excluded files
-    current_tokens = structure_tokens  # Start with tokens for structure
-    
-    for file_info in prioritized_files:
-        # Check if adding this file would exceed the token limit
-        if current_tokens + file_info['tokens'] <= max_tokens:
+    for file_info, selected in zip(prioritized_files, selected_mask):
+        if selected:
             selected_files.append(file_info)
-            current_tokens += file_info['tokens']
         else:
-            # If we've already selected high-priority files and this one would exceed the limit,
-            # skip it and try the next one (which might be smaller)
             file_info['reason'] = "Token limit exceeded"
             excluded_files.append(file_info)
-            continue
     
     if not selected_files:
         print("No files selected - token limit may be too low or no files match criteria")
@@ -167,7 +249,7 @@ def organize_files(files_info, max_tokens, generate_structure=True, generate_rea
     
     # Get project root path from config
     # Instead of using different paths from each file, use a single project path
-    root_path = os.path.commonpath([file_info['abs_path'] for file_info in selected_files])
+    root_path = _common_root(file_info['abs_path'] for file_info in selected_files)
     project_name = get_project_name(root_path)
     
     # Create a single output directory for the project
@@ -200,100 +282,51 @@ def organize_files(files_info, max_tokens, generate_structure=True, generate_rea
     except ImportError as e:
         print(f"Warning: File tracker module not found, report not generated: {e}")
         
-    # Generate structure if enabled
+    # Build the directory tree if structure generation is enabled; file content
+    # is attached only after the README, which needs just the tree's shape
     structure = None
     if generate_structure:
         try:
-            from src.core.structure_generator import generate_structure as gen_structure
-            
-            # Default exclusions for structure
-            exclude_dirs = [
-                # Python related
-                '__pycache__', '*.pyc', '*.pyo', '*.pyd', '*.so', '*.dll',
-                'venv', '.venv', 'env', '.env', 'virtualenv',
-                'dist', 'build', 'eggs', 'parts', 'bin', 'var',
-                'sdist', 'develop-eggs', '.installed.cfg', 'lib', 'lib64',
-                
-                # JavaScript/Node related
-                'node_modules', 'bower_components', '.npm', '.yarn',
-                
-                # Version control
-                '.git', '.hg', '.svn', '.cvs', '.bzr',
-                
-                # IDE and editors
-                '.idea', '.vscode', '*.swp', '*.swo', '*.swn', '*.bak',
-                
-                # OS specific
-                '.DS_Store', 'Thumbs.db', 'ehthumbs.db',
-                
-                # Project specific
-                'output', 'logs', 'temp', 'tmp', 'cache',
-                
-                # Package directories
-                'site-packages', '.pytest_cache'
-            ]
+            from src.core.structure_generator import build_directory_structure
             
             # Generate structure with exclusions
-            structure_json = gen_structure(root_path, selected_files, exclude_dirs)
-            
-            # Save structure to a file in the export folder
-            structure_path = os.path.join(export_folder, f"{project_name}_structure.json")
-            with open(structure_path, 'w') as f:
-                f.write(structure_json)
-                
-            structure = structure_json
-            print(f"Structure saved to {structure_path}")
+            structure = build_directory_structure(root_path, list(STRUCTURE_EXCLUDE_DIRS))
         except Exception as e:
             print(f"Error generating structure: {e}")
 
     # Generate README if enabled and structure is available
     if generate_readme and structure:
         try:
-            from src.core.readme_generator import generate_readme, save_readme
-            import json
+            from src.core.readme_generator import iter_readme, save_readme
             
-            # Default exclusions for README
-            exclude_dirs = [
-                # Python related
-                '__pycache__/', '*.pyc', '*.pyo', '*.pyd', '*.so', '*.dll',
-                'venv/', '.venv/', 'env/', '.env/', 'virtualenv/',
-                'dist/', 'build/', 'eggs/', 'parts/', 'bin/', 'var/',
-                'sdist/', 'develop-eggs/', '.installed.cfg', 'lib/', 'lib64/',
-                
-                # JavaScript/Node related
-                'node_modules/', 'bower_components/', '.npm/', '.yarn/',
-                
-                # Version control
-                '.git/', '.hg/', '.svn/', '.cvs/', '.bzr/',
-                
-                # IDE and editors
-                '.idea/', '.vscode/', '*.swp', '*.swo', '*.swn', '*.bak',
-                
-                # OS specific
-                '.DS_Store/', 'Thumbs.db/', 'ehthumbs.db/',
-                
-                # Project specific
-                'output/', 'logs/', 'temp/', 'tmp/', 'cache/',
-                
-                # Package directories
-                'site-packages/', '.pytest_cache/'
-            ]
-            
-            # Generate README
-            readme_content = generate_readme(
-                json.loads(structure), 
+            # Generate README, writing it to the export folder as it is produced
+            readme_chunks = iter_readme(
+                structure, 
                 selected_files, 
                 project_name,
-                exclude_dirs=exclude_dirs
+                exclude_dirs=list(README_EXCLUDE_DIRS)
             )
-            
-            # Save README to the export folder
             readme_path = os.path.join(export_folder, f"{project_name}_README.md")
-            save_readme(readme_content, readme_path)
+            save_readme(readme_chunks, readme_path)
             print(f"README saved to {readme_path}")
         except Exception as e:
             print(f"Error generating README: {e}")
 
+    # Add file content and save the structure
+    if structure:
+        try:
+            from src.core.structure_generator import add_file_content, write_structure
+            
+            add_file_content(structure, selected_files)
+            
+            # Save structure to a file in the export folder, serializing straight into it
+            structure_path = os.path.join(export_folder, f"{project_name}_structure.json")
+            write_structure(structure, structure_path)
+                
+            print(f"Structure saved to {structure_path}")
+        except Exception as e:
+            print(f"Error generating structure: {e}")
+
     print(f"Selected {len(selected_files)} out of {len(files_info)} files")
     print(f"Total tokens: {current_tokens} / {max_tokens}")
     print(f"Files exported to: {export_folder}")
@@ -314,9 +347,8 @@ def copy_files_to_output(selected_files, export_folder):
         output_filename = normalize_filename(file_info['path'])
         output_path = os.path.join(export_folder, output_filename)
         
-        # Copy file content
-        with open(output_path, 'w', encoding='utf-8', errors='replace') as f:
-            f.write(file_info['content'])
+        # Copy the file straight from disk (lets the OS use sendfile/copy_file_range)
+        shutil.copyfile(file_info['abs_path'], output_path)
 
 
 def create_summary_file(selected_files, total_tokens, max_tokens, export_folder, project_name):
@@ -332,27 +364,24 @@ def create_summary_file(selected_files, total_tokens, max_tokens, export_folder,
     """
     summary_path = os.path.join(export_folder, "_SUMMARY.txt")
     
+    lines = [
+        "Claude AI File Organizer Summary\n",
+        "===============================\n\n",
+        f"Project: {project_name}\n",
+        f"Export Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+        f"Total Files: {len(selected_files)}\n",
+        f"Total Tokens: {total_tokens} / {max_tokens} ({total_tokens/max_tokens*100:.1f}%)\n\n",
+        "Files by Importance:\n",
+        "------------------\n"
+    ]
+    
+    # Files arrive sorted by importance from prioritize_files, so the stable
+    # sort is a single linear pass and groupby yields each level once
+    ordered_files = sorted(selected_files, key=lambda file_info: -file_info['importance'])
+    for importance, group in groupby(ordered_files, key=itemgetter('importance')):
+        lines.append(f"\nImportance Level: {importance}\n")
+        lines.extend(f"  - {file_info['path']} ({file_info['tokens']} tokens)\n" for file_info in group)
+    
+    # Write the whole summary at once
     with open(summary_path, 'w', encoding='utf-8') as f:
-        f.write(f"Claude AI File Organizer Summary\n")
-        f.write(f"===============================\n\n")
-        f.write(f"Project: {project_name}\n")
-        f.write(f"Export Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Total Files: {len(selected_files)}\n")
-        f.write(f"Total Tokens: {total_tokens} / {max_tokens} ({total_tokens/max_tokens*100:.1f}%)\n\n")
-        
-        f.write(f"Files by Importance:\n")
-        f.write(f"------------------\n")
-        
-        # Group files by importance
-        importance_groups = {}
-        for file_info in selected_files:
-            importance = file_info['importance']
-            if importance not in importance_groups:
-                importance_groups[importance] = []
-            importance_groups[importance].append(file_info)
-        
-        # Write files sorted by importance
-        for importance in sorted(importance_groups.keys(), reverse=True):
-            f.write(f"\nImportance Level: {importance}\n")
-            for file_info in importance_groups[importance]:
-                f.write(f"  - {file_info['path']} ({file_info['tokens']} tokens)\n")
\ No newline at end of file
+        f.write(''.join(lines))
@@ -3,10 +3,228 @@ File scanning and path filtering logic for Claude AI File Organizer.
 """
 
 import os
+import re
+import codecs
 import fnmatch
 import glob
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional, Pattern
+from src.utils.cache import load_cache, save_cache
 from src.utils.config import load_important_files
+from src.utils.ignore import read_ignore_patterns
+from src.core.token_counter import has_tiktoken
+
+
+# Number of leading bytes checked when deciding whether a file is text
+TEXT_PROBE_BYTES = 4096
+
+# Per-project cache of text probes and token counts, kept between runs
+SCAN_CACHE_FILENAME = '.scan_cache.json'
+
+_UTF8_DECODER = codecs.getincrementaldecoder('utf-8')
+
+
+@dataclass(frozen=True)
+class IgnorePatterns:
+    """Ignore patterns split into literal lookups and one regex each for directories and file names."""
+    patterns: tuple
+    dir_regex: Optional[Pattern]
+    file_regex: Optional[Pattern]
+    # True when no directory pattern can span a path separator, so a
+    # directory can be checked by its name alone once its parents passed
+    dir_names_only: bool = True
+    # Patterns without wildcards, checked before falling back to the regexes
+    dir_literals: tuple = ()
+    file_literals: frozenset = frozenset()
+    # Extensions (with the dot) from '*.ext' file patterns, checked by set lookup
+    file_extensions: frozenset = frozenset()
+    ignore_case: bool = False
+
+
+@dataclass(frozen=True)
+class ImportantPatterns:
+    """Important files list split into lookup sets, one regex, and the recursive ('**') patterns."""
+    patterns: tuple
+    literals: frozenset
+    extensions: frozenset
+    regex: Optional[Pattern]
+    # '**' patterns, matched against the files build_important_matches globbed
+    recursive: tuple
+    ignore_case: bool = False
+
+
+@dataclass(frozen=True)
+class ImportanceRules:
+    """Importance settings from the config, split into lookup sets once per scan."""
+    formats: frozenset
+    files: frozenset
+    paths: tuple
+
+
+def compile_importance_rules(config):
+    """
+    Split the comma separated importance settings into sets.
+    
+    Args:
+        config (dict): Configuration with importance settings
+        
+    Returns:
+        ImportanceRules: Parsed importance settings
+    """
+    file_importance = config['file_importance']
+    
+    return ImportanceRules(
+        formats=frozenset(ext.strip() for ext in file_importance.get('important_formats', '').split(',')),
+        files=frozenset(name.strip() for name in file_importance.get('important_files', '').split(',')),
+        paths=tuple(path.strip() for path in file_importance.get('important_paths', '').split(',') if path.strip())
+    )
+
+
+@lru_cache(maxsize=4096)
+def _name_importance(file_name, rules):
+    """
+    Score a file by its name and extension.
+    
+    Args:
+        file_name (str): Base name of the file
+        rules (ImportanceRules): Parsed importance settings
+        
+    Returns:
+        int: Importance from the extension and file name rules
+    """
+    importance = 0
+    file_ext = os.path.splitext(file_name)[1].lower()
+    
+    # Check if file extension is important
+    if file_ext in rules.formats:
+        importance += 10
+    
+    # Check if file name is important
+    if file_name in rules.files:
+        importance += 20
+    
+    return importance
+
+
+def compile_ignore_patterns(patterns):
+    """
+    Compile ignore patterns so a path can be checked with cheap lookups.
+    
+    Directory patterns (ending in '/') match anywhere in the path, file
+    patterns match the file name, both with fnmatch semantics. Patterns
+    without wildcards become substring and set lookups, '*.ext' file
+    patterns become an extension set, and the rest are combined into one
+    regex per kind.
+    
+    Args:
+        patterns (list): List of patterns to ignore
+        
+    Returns:
+        IgnorePatterns: Compiled ignore patterns
+    """
+    # fnmatch is case-insensitive wherever the OS path case is
+    ignore_case = os.path.normcase('A') == 'a'
+    flags = re.IGNORECASE if ignore_case else 0
+    
+    dir_patterns = [pattern[:-1] for pattern in patterns if pattern.endswith('/')]
+    file_patterns = [pattern for pattern in patterns if not pattern.endswith('/')]
+    
+    dir_literals = [pattern for pattern in dir_patterns if not _has_wildcard(pattern)]
+    file_literals = [pattern for pattern in file_patterns if not _has_wildcard(pattern)]
+    file_extensions = [pattern[1:] for pattern in file_patterns if _is_extension_pattern(pattern)]
+    dir_parts = [fnmatch.translate(f"*{pattern}*") for pattern in dir_patterns if _has_wildcard(pattern)]
+    file_parts = [
+        fnmatch.translate(pattern) for pattern in file_patterns
+        if _has_wildcard(pattern) and not _is_extension_pattern(pattern)
+    ]
+    
+    if ignore_case:
+        dir_literals = [pattern.lower() for pattern in dir_literals]
+        file_literals = [pattern.lower() for pattern in file_literals]
+        file_extensions = [extension.lower() for extension in file_extensions]
+    
+    return IgnorePatterns(
+        patterns=tuple(patterns),
+        dir_regex=re.compile('|'.join(dir_parts), flags) if dir_parts else None,
+        file_regex=re.compile('|'.join(file_parts), flags) if file_parts else None,
+        dir_names_only=not any(char in pattern for pattern in dir_patterns for char in '/\\*?['),
+        dir_literals=tuple(dir_literals),
+        file_literals=frozenset(file_literals),
+        file_extensions=frozenset(file_extensions),
+        ignore_case=ignore_case
+    )
+
+
+def _has_wildcard(pattern):
+    """
+    Check if an fnmatch pattern contains wildcard characters.
+    
+    Args:
+        pattern (str): Pattern to check
+        
+    Returns:
+        bool: True if the pattern uses '*', '?' or '['
+    """
+    return any(char in pattern for char in '*?[')
+
+
+def _is_extension_pattern(pattern):
+    """
+    Check if a file pattern only matches by extension, like '*.pyc'.
+    
+    Args:
+        pattern (str): Pattern to check
+        
+    Returns:
+        bool: True if the pattern is '*.' followed by a plain, dot-free suffix
+    """
+    suffix = pattern[2:]
+    return pattern.startswith('*.') and bool(suffix) and '.' not in suffix and not _has_wildcard(suffix)
+
+
+def _matches_dir_pattern(path, ignore_patterns):
+    """
+    Check a path against the directory ignore patterns.
+    
+    Args:
+        path (str): Path (or directory name) with '/' separators
+        ignore_patterns (IgnorePatterns): Compiled patterns to ignore
+        
+    Returns:
+        bool: True if a directory pattern matches
+    """
+    if ignore_patterns.dir_literals:
+        folded_path = path.lower() if ignore_patterns.ignore_case else path
+        if any(literal in folded_path for literal in ignore_patterns.dir_literals):
+            return True
+    
+    return bool(ignore_patterns.dir_regex and ignore_patterns.dir_regex.match(path))
+
+
+def _matches_file_pattern(name, ignore_patterns):
+    """
+    Check a file or directory name against the file ignore patterns.
+    
+    Args:
+        name (str): Base name to check
+        ignore_patterns (IgnorePatterns): Compiled patterns to ignore
+        
+    Returns:
+        bool: True if a file pattern matches
+    """
+    folded_name = name.lower() if ignore_patterns.ignore_case else name
+    if folded_name in ignore_patterns.file_literals:
+        return True
+    
+    # '*.ext' matches any name whose last dot starts that suffix, even '.ext' itself
+    if ignore_patterns.file_extensions:
+        dot = folded_name.rfind('.')
+        if dot != -1 and folded_name[dot:] in ignore_patterns.file_extensions:
+            return True
+    
+    return bool(ignore_patterns.file_regex and ignore_patterns.file_regex.match(name))
 
 
 def load_ignore_patterns(ignore_file_path):
@@ -17,20 +235,14 @@ def load_ignore_patterns(ignore_file_path):
         ignore_file_path (Path): Path to the ignore file
         
     Returns:
-        list: List of patterns to ignore
+        IgnorePatterns: Compiled patterns to ignore
     """
-    patterns = []
+    try:
+        patterns = read_ignore_patterns(ignore_file_path)
+    except FileNotFoundError:
+        patterns = []
     
-    if ignore_file_path.exists():
-        with open(ignore_file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                # Skip comments and empty lines
-                if not line or line.startswith('#'):
-                    continue
-                patterns.append(line)
-    
-    return patterns
+    return compile_ignore_patterns(patterns)
 
 
 def should_ignore(path, ignore_patterns):
@@ -39,89 +251,374 @@ def should_ignore(path, ignore_patterns):
     
     Args:
         path (str): Path to check
-        ignore_patterns (list): List of patterns to ignore
+        ignore_patterns (IgnorePatterns or list): Compiled patterns, or a plain
+            list of patterns which is compiled on the fly
         
     Returns:
         bool: True if the path should be ignored, False otherwise
     """
+    if not isinstance(ignore_patterns, IgnorePatterns):
+        ignore_patterns = compile_ignore_patterns(ignore_patterns)
+    
     normalized_path = path.replace('\\', '/')
     
-    for pattern in ignore_patterns:
-        # Directory match - pattern ends with '/'
-        if pattern.endswith('/'):
-            dir_pattern = pattern[:-1]  # Remove trailing slash
-            if fnmatch.fnmatch(normalized_path, f"*{dir_pattern}*"):
-                return True
-        # File match
-        elif fnmatch.fnmatch(os.path.basename(normalized_path), pattern):
+    # Directory match - pattern ends with '/'
+    if _matches_dir_pattern(normalized_path, ignore_patterns):
+        return True
+    
+    # File match
+    return _matches_file_pattern(os.path.basename(normalized_path), ignore_patterns)
+
+
+def compile_important_patterns(patterns):
+    """
+    Compile important file patterns so a file can be checked with cheap lookups.
+    
+    Patterns match the file name or its path with fnmatch semantics.
+    Patterns without wildcards become a set lookup, '*.ext' patterns an
+    extension set, and the rest one combined regex. Recursive ('**')
+    patterns are kept apart for build_important_matches to glob.
+    
+    Args:
+        patterns (iterable): File patterns to prioritize
+        
+    Returns:
+        ImportantPatterns: Compiled important file patterns
+    """
+    # fnmatch is case-insensitive wherever the OS path case is
+    ignore_case = os.path.normcase('A') == 'a'
+    fold = str.lower if ignore_case else str
+    
+    patterns = tuple(patterns)
+    recursive = tuple(pattern for pattern in patterns if '**' in pattern)
+    flat = [pattern for pattern in patterns if '**' not in pattern]
+    
+    regex_parts = [
+        fnmatch.translate(pattern) for pattern in flat
+        if _has_wildcard(pattern) and not _is_extension_pattern(pattern)
+    ]
+    
+    return ImportantPatterns(
+        patterns=patterns,
+        literals=frozenset(fold(pattern) for pattern in flat if not _has_wildcard(pattern)),
+        extensions=frozenset(fold(pattern[1:]) for pattern in flat if _is_extension_pattern(pattern)),
+        regex=re.compile('|'.join(regex_parts), re.IGNORECASE if ignore_case else 0) if regex_parts else None,
+        recursive=recursive,
+        ignore_case=ignore_case
+    )
+
+
+def _matches_important_pattern(file_name, path, important_patterns):
+    """
+    Check a file against the non-recursive important file patterns.
+    
+    Args:
+        file_name (str): Base name of the file
+        path (str): Path of the file with '/' separators
+        important_patterns (ImportantPatterns): Compiled important file patterns
+        
+    Returns:
+        bool: True if a pattern matches the name or the path
+    """
+    if important_patterns.ignore_case:
+        file_name = file_name.lower()
+        path = path.lower()
+    
+    if file_name in important_patterns.literals or path in important_patterns.literals:
+        return True
+    
+    if important_patterns.extensions:
+        dot = file_name.rfind('.')
+        if dot != -1 and file_name[dot:] in important_patterns.extensions:
             return True
     
-    return False
+    regex = important_patterns.regex
+    return bool(regex and (regex.match(file_name) or regex.match(path)))
+
+
+@lru_cache(maxsize=None)
+def _load_important_patterns(important_files_path, file_version):
+    """
+    Load and compile the important files list once per path and file version.
+    
+    Args:
+        important_files_path (str): Absolute path to the important files specification
+        file_version (tuple): (mtime_ns, size) of the file, or None if it is missing;
+            part of the cache key
+        
+    Returns:
+        ImportantPatterns: Compiled important file patterns
+    """
+    return compile_important_patterns(load_important_files(important_files_path))
 
 
-def calculate_importance(file_path, config):
+def get_important_patterns(important_files_path):
+    """
+    Get the important file patterns, re-reading the file only when it changes.
+    
+    Args:
+        important_files_path (str): Path to the important files specification
+        
+    Returns:
+        ImportantPatterns: Compiled important file patterns
+    """
+    important_files_path = os.path.abspath(important_files_path)
+    try:
+        file_stat = os.stat(important_files_path)
+        file_version = (file_stat.st_mtime_ns, file_stat.st_size)
+    except OSError:
+        file_version = None
+    
+    return _load_important_patterns(important_files_path, file_version)
+
+
+def _normalize_abs_path(path):
+    """
+    Normalize a path for comparison without touching the filesystem.
+    
+    Args:
+        path (str): Path to normalize
+        
+    Returns:
+        str: Absolute, case-normalized path
+    """
+    return os.path.normcase(os.path.abspath(path))
+
+
+def build_important_matches(config):
+    """
+    Resolve the recursive ('**') important file patterns to the files they match.
+    
+    Each pattern is globbed once, so callers can check membership per file
+    instead of re-walking the disk for every file.
+    
+    Args:
+        config (dict): Configuration with importance settings
+        
+    Returns:
+        dict: Mapping of pattern to a set of normalized absolute file paths
+    """
+    important_files_path = config['settings'].get('important_files_path', 'important_files.txt')
+    if not important_files_path:
+        return {}
+    
+    root_dir = os.path.dirname(os.path.abspath(important_files_path))
+    matches = {}
+    
+    for pattern in get_important_patterns(important_files_path).recursive:
+        glob_pattern = os.path.join(root_dir, pattern)
+        matches[pattern] = {
+            _normalize_abs_path(match)
+            for match in glob.glob(glob_pattern, recursive=True)
+            if os.path.isfile(match)
+        }
+    
+    return matches
+
+
+def calculate_importance(file_path, config, important_matches=None, rules=None, important_patterns=None):
     """
     Calculate importance score for a file based on config settings.
     
     Args:
         file_path (str): Path to the file
         config (dict): Configuration with importance settings
+        important_matches (dict, optional): Result of build_important_matches,
+            computed on the fly when not given
+        rules (ImportanceRules, optional): Result of compile_importance_rules,
+            computed on the fly when not given
+        important_patterns (ImportantPatterns, optional): Result of
+            get_important_patterns, looked up on the fly when not given
         
     Returns:
         int: Importance score (higher is more important)
     """
-    importance = 0
-    file_name = os.path.basename(file_path)
-    file_ext = os.path.splitext(file_name)[1].lower()
+    if rules is None:
+        rules = compile_importance_rules(config)
     
-    # Check if file extension is important
-    important_formats = config['file_importance'].get('important_formats', '').split(',')
-    if any(file_ext == ext.strip() for ext in important_formats):
-        importance += 10
-    
-    # Check if file name is important
-    important_files = config['file_importance'].get('important_files', '').split(',')
-    if any(file_name == important_file.strip() for important_file in important_files):
-        importance += 20
+    file_name = os.path.basename(file_path)
+    importance = _name_importance(file_name, rules)
     
     # Check if file is in an important path
-    important_paths = config['file_importance'].get('important_paths', '').split(',')
     normalized_path = file_path.replace('\\', '/')
-    if any(path.strip() in normalized_path for path in important_paths if path.strip()):
+    if any(path in normalized_path for path in rules.paths):
         importance += 5
     
     # Check against important files list if config has the path
-    important_files_path = config['settings'].get('important_files_path', 'important_files.txt')
-    if important_files_path:
-        try:
-            important_patterns = load_important_files(important_files_path)
-            
-            # Check if the file matches any pattern in the important files list
-            for pattern in important_patterns:
-                # Check for recursive pattern with '**'
-                if '**' in pattern:
-                    # Convert pattern to glob pattern and check if file matches
-                    # Replace single asterisks with glob patterns
-                    root_dir = os.path.dirname(os.path.abspath(important_files_path))
-                    glob_pattern = os.path.join(root_dir, pattern)
-                    matching_files = glob.glob(glob_pattern, recursive=True)
-                    
-                    # Check if the file matches any of the globbed files
-                    abs_file_path = os.path.abspath(file_path)
-                    if any(os.path.samefile(abs_file_path, match) for match in matching_files if os.path.isfile(match)):
-                        importance += 15
-                        break
-                # Standard pattern matching with fnmatch
-                elif fnmatch.fnmatch(file_name, pattern) or fnmatch.fnmatch(normalized_path, pattern):
+    try:
+        if important_patterns is None:
+            important_files_path = config['settings'].get('important_files_path', 'important_files.txt')
+            if important_files_path:
+                important_patterns = get_important_patterns(important_files_path)
+        
+        # Check if the file matches any pattern in the important files list,
+        # then the recursive '**' patterns against the pre-globbed files
+        if important_patterns is not None:
+            if _matches_important_pattern(file_name, normalized_path, important_patterns):
+                importance += 15
+            elif important_patterns.recursive:
+                if important_matches is None:
+                    important_matches = build_important_matches(config)
+                abs_file_path = _normalize_abs_path(file_path)
+                if any(abs_file_path in important_matches.get(pattern, ()) for pattern in important_patterns.recursive):
                     importance += 15
-                    break
-        except Exception as e:
-            print(f"Warning: Error checking important files list: {e}")
+    except Exception as e:
+        print(f"Warning: Error checking important files list: {e}")
     
     return importance
 
 
-def scan_directory(root_path, config, ignore_file_path):
+def _scan_cache_version():
+    """
+    Identify how cached token counts were produced.
+    
+    Returns:
+        str: Cache version, which changes when the token counting method does
+    """
+    return 'tiktoken' if has_tiktoken() else 'simple'
+
+
+def load_scan_cache(cache_dir):
+    """
+    Load the scan cache from a directory.
+    
+    The cache maps absolute file paths to [mtime_ns, size, is_text, tokens],
+    so unchanged files skip the text probe and token estimation.
+    
+    Args:
+        cache_dir (str): Directory holding the cache file
+        
+    Returns:
+        dict: Scan cache, empty if missing or built with another token counter
+    """
+    version = _scan_cache_version()
+    cache = load_cache(os.path.join(cache_dir, SCAN_CACHE_FILENAME))
+    
+    if cache.get('version') != version or not isinstance(cache.get('files'), dict):
+        return {'version': version, 'files': {}}
+    
+    return cache
+
+
+def save_scan_cache(cache_dir, cache):
+    """
+    Save the scan cache to a directory.
+    
+    Args:
+        cache_dir (str): Directory holding the cache file
+        cache (dict): Scan cache to save
+        
+    Returns:
+        bool: True if the cache was saved, False otherwise
+    """
+    return save_cache(os.path.join(cache_dir, SCAN_CACHE_FILENAME), cache)
+
+
+def _should_ignore_entry(entry, rel_path, ignore_patterns):
+    """
+    Check if a file or directory found by the walk should be ignored.
+    
+    When no directory pattern can span a path separator, only the entry's
+    name is checked: the walk never descends into an ignored directory, so
+    the ancestors in rel_path are already known not to match.
+    
+    Args:
+        entry (os.DirEntry): Directory entry
+        rel_path (str): Path of the entry relative to the scan root
+        ignore_patterns (IgnorePatterns): Compiled patterns to ignore
+        
+    Returns:
+        bool: True if the entry should be ignored, False otherwise
+    """
+    if not ignore_patterns.dir_names_only:
+        return should_ignore(rel_path, ignore_patterns)
+    
+    name = entry.name
+    return _matches_dir_pattern(name, ignore_patterns) or _matches_file_pattern(name, ignore_patterns)
+
+
+def _walk_scandir(dir_path, rel_dir, ignore_patterns):
+    """
+    Recursively yield files under a directory that are not ignored.
+    
+    Files of a directory are yielded before descending into its
+    subdirectories, matching os.walk's top-down order. Each file costs
+    a single stat, taken from its directory entry.
+    
+    Args:
+        dir_path (str): Directory to list
+        rel_dir (str): Path of the directory relative to the scan root,
+            empty for the root itself
+        ignore_patterns (IgnorePatterns): Compiled patterns to ignore
+        
+    Yields:
+        tuple: (file_path, rel_path, stat_result)
+    """
+    subdirs = []
+    
+    try:
+        entries = os.scandir(dir_path)
+    except OSError:
+        # Missing or unreadable directories are skipped, as os.walk does
+        return
+    
+    with entries:
+        for entry in entries:
+            rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+            
+            if entry.is_dir():
+                # Like os.walk, don't descend into symlinked directories
+                if not entry.is_symlink() and not _should_ignore_entry(entry, rel_path, ignore_patterns):
+                    subdirs.append((entry.path, rel_path))
+                continue
+            
+            # Skip ignored files
+            if _should_ignore_entry(entry, rel_path, ignore_patterns):
+                continue
+            
+            try:
+                file_stat = entry.stat()
+            except OSError as e:
+                print(f"Warning: Error processing file {entry.path}: {e}")
+                continue
+            
+            yield entry.path, rel_path, file_stat
+    
+    for subdir, rel_subdir in subdirs:
+        yield from _walk_scandir(subdir, rel_subdir, ignore_patterns)
+
+
+def _is_text_file(file_path):
+    """
+    Check whether a file's leading bytes look like UTF-8 text.
+    
+    A single raw read is used for the probe; files with NUL bytes are
+    treated as binary even though NUL is valid UTF-8.
+    
+    Args:
+        file_path (str): Path to the file
+        
+    Returns:
+        bool: True if the file looks like text
+    """
+    try:
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            head = os.read(fd, TEXT_PROBE_BYTES)
+        finally:
+            os.close(fd)
+        
+        if b'\x00' in head:
+            return False
+        
+        # An incremental decoder tolerates a character cut off at the end of the chunk
+        _UTF8_DECODER().decode(head, final=False)
+        return True
+    except (UnicodeDecodeError, OSError):
+        return False
+
+
+def scan_directory(root_path, config, ignore_file_path, cache=None):
     """
     Scan directory and collect information about files.
     
@@ -129,50 +626,53 @@ def scan_directory(root_path, config, ignore_file_path):
         root_path (str): Root directory to scan
         config (dict): Configuration dictionary
         ignore_file_path (Path): Path to the ignore file
+        cache (dict, optional): Scan cache from load_scan_cache; entries for
+            changed or removed files are dropped
         
     Returns:
         list: List of dictionaries with file information
     """
     files_info = []
+    cached_files = cache['files'] if cache is not None else {}
+    scanned_files = {}
     ignore_patterns = load_ignore_patterns(ignore_file_path)
     
-    for dirpath, dirnames, filenames in os.walk(root_path):
-        # Skip ignored directories to improve performance
-        dirnames[:] = [d for d in dirnames if not should_ignore(os.path.join(dirpath, d), ignore_patterns)]
-        
-        for filename in filenames:
-            file_path = os.path.join(dirpath, filename)
-            rel_path = os.path.relpath(file_path, root_path)
+    # Resolve the important file patterns and glob the recursive ones once
+    # for the whole scan
+    important_patterns = None
+    try:
+        important_files_path = config['settings'].get('important_files_path', 'important_files.txt')
+        if important_files_path:
+            important_patterns = get_important_patterns(important_files_path)
+        important_matches = build_important_matches(config)
+    except Exception as e:
+        print(f"Warning: Error checking important files list: {e}")
+        important_matches = {}
+    importance_rules = compile_importance_rules(config)
+    
+    for file_path, rel_path, file_stat in _walk_scandir(root_path, '', ignore_patterns):
+        file_size = file_stat.st_size
+        try:
+            importance = calculate_importance(rel_path, config, important_matches, importance_rules, important_patterns)
             
-            # Skip ignored files
-            if should_ignore(rel_path, ignore_patterns):
-                continue
+            # Reuse the text probe if the file is unchanged since the last run
+            entry = cached_files.get(file_path)
+            if not entry or entry[:2] != [file_stat.st_mtime_ns, file_size]:
+                entry = [file_stat.st_mtime_ns, file_size, _is_text_file(file_path), None]
+            scanned_files[file_path] = entry
             
-            try:
-                # Get file size and calculate importance
-                file_size = os.path.getsize(file_path)
-                importance = calculate_importance(rel_path, config)
-                
-                # Check if file is readable as text
-                is_text = False
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        # Try to read first few lines
-                        for _ in range(5):
-                            f.readline()
-                        is_text = True
-                except (UnicodeDecodeError, IOError):
-                    is_text = False
-                
-                # Only include text files
-                if is_text:
-                    files_info.append({
-                        'path': rel_path,
-                        'abs_path': file_path,
-                        'size': file_size,
-                        'importance': importance
-                    })
-            except (IOError, OSError) as e:
-                print(f"Warning: Error processing file {file_path}: {e}")
-    
-    return files_info
\ No newline at end of file
+            # Only include text files
+            if entry[2]:
+                files_info.append({
+                    'path': rel_path,
+                    'abs_path': file_path,
+                    'size': file_size,
+                    'importance': importance
+                })
+        except (IOError, OSError) as e:
+            print(f"Warning: Error processing file {file_path}: {e}")
+    
+    if cache is not None:
+        cache['files'] = scanned_files
+    
+    return files_info
@@ -3,9 +3,31 @@ README.md generation functionality for Claude AI File Organizer.
 """
 
 import os
+import re
 import json
+import heapq
+from collections import Counter
+from itertools import chain, takewhile
+from operator import itemgetter
 from pathlib import Path
 
+from src.core.exclusions import ALWAYS_EXCLUDE_DIRS, EXCLUDED_EXTENSIONS, contains_excluded
+
+
+# Directories never shown in the formatted structure, whatever the exclusions
+_ALWAYS_HIDDEN_DIRS = frozenset({"__pycache__", "venv", ".venv", "node_modules"})
+
+# Sort key for structure nodes
+_name_key = itemgetter("name")
+
+# Lowercased names of files worth pointing out in the README
+_IMPORTANT_FILENAMES = frozenset({
+    "readme.md", "setup.py", "requirements.txt", "config.ini", "main.py", "package.json"
+})
+
+# A quoted description= argument in setup.py, not long_description=
+_SETUP_DESCRIPTION_PATTERN = re.compile(r'(?<![\w.])description\s*=\s*([\'"])(.*?)\1', re.DOTALL)
+
 
 def analyze_project_structure(structure_data, exclude_dirs=None):
     """
@@ -16,7 +38,7 @@ def analyze_project_structure(structure_data, exclude_dirs=None):
         exclude_dirs (list, optional): List of directory paths to exclude
         
     Returns:
-        dict: Analysis results with file counts, key directories, etc.
+        dict: Analysis results with file counts (file_types is a Counter), the main language, key directories, etc.
     """
     if exclude_dirs is None:
         # Default exclusions
@@ -26,36 +48,26 @@ def analyze_project_structure(structure_data, exclude_dirs=None):
         
     analysis = {
         "total_files": 0,
-        "file_types": {},
+        "file_types": Counter(),
         "key_directories": [],
         "important_files": []
     }
     
     def should_exclude_dir(dir_name, path):
         """Check if a directory should be excluded."""
-        # Common directories to always exclude
-        always_exclude = ['__pycache__', 'venv', '.venv', 'node_modules', '.git', 
-                          'dist', 'build', 'eggs', 'site-packages']
-        
         # Check if the directory name is in the always exclude list
-        if dir_name in always_exclude:
+        if dir_name in ALWAYS_EXCLUDE_DIRS:
             return True
             
         # Check if the directory path contains any of the exclude patterns
         full_path = f"{path}/{dir_name}" if path else dir_name
-        if any(excluded_dir in f"{full_path}/" for excluded_dir in exclude_dirs):
-            return True
-            
-        return False
+        return contains_excluded(f"{full_path}/", exclude_dirs)
     
     def should_exclude_file(file_name):
         """Check if a file should be excluded."""
-        # Common file extensions to exclude
-        exclude_extensions = ['.pyc', '.pyo', '.pyd', '.so', '.dll', '.exe']
-        
         # Check file extension
         _, ext = os.path.splitext(file_name)
-        if ext.lower() in exclude_extensions:
+        if ext.lower() in EXCLUDED_EXTENSIONS:
             return True
             
         # Check for other patterns
@@ -64,32 +76,32 @@ def analyze_project_structure(structure_data, exclude_dirs=None):
             
         return False
     
-    def traverse_structure(node, path=""):
-        """Recursively traverse the structure to gather statistics."""
+    # Walk the tree with an explicit stack; children are pushed in reverse so
+    # nodes are visited in the same order as a recursive pre-order walk
+    stack = [(structure_data, "")]
+    while stack:
+        node, path = stack.pop()
+        
         if node["type"] == "file":
             # Skip excluded file types
             if should_exclude_file(node["name"]):
-                return
+                continue
                 
             analysis["total_files"] += 1
             
             # Count file types
             file_ext = os.path.splitext(node["name"])[1].lower()
             if file_ext:
-                if file_ext not in analysis["file_types"]:
-                    analysis["file_types"][file_ext] = 0
                 analysis["file_types"][file_ext] += 1
             
             # Note important files
-            important_filenames = ["readme.md", "setup.py", "requirements.txt", 
-                                 "config.ini", "main.py", "package.json"]
-            if node["name"].lower() in important_filenames:
+            if node["name"].lower() in _IMPORTANT_FILENAMES:
                 analysis["important_files"].append(path + "/" + node["name"])
         
         elif node["type"] == "directory":
             # Skip excluded directories
             if should_exclude_dir(node["name"], path):
-                return
+                continue
                 
             current_path = path + "/" + node["name"] if path else node["name"]
             
@@ -103,22 +115,54 @@ def analyze_project_structure(structure_data, exclude_dirs=None):
             if len(py_files) >= 2:
                 analysis["key_directories"].append(current_path)
             
-            # Recursive traversal
-            for child in node.get("children", []):
-                traverse_structure(child, current_path)
+            stack.extend((child, current_path) for child in reversed(node.get("children", [])))
     
-    traverse_structure(structure_data)
-    
-    # Sort file types by frequency
-    analysis["file_types"] = dict(sorted(
-        analysis["file_types"].items(), 
-        key=lambda item: item[1], 
-        reverse=True
-    ))
+    # Only the most common file type is needed, so skip sorting them all
+    top_types = analysis["file_types"].most_common(1)
+    analysis["main_language"] = top_types[0][0] if top_types else "Unknown"
     
     return analysis
 
 
+def _read_file_content(file_info):
+    """
+    Read a file's content on demand, since file information does not keep it.
+    
+    Args:
+        file_info (dict): File information dictionary
+        
+    Returns:
+        str: File content or empty string if it can't be read
+    """
+    if "content" in file_info:
+        return file_info["content"]
+    if "abs_path" not in file_info:
+        return ""
+    
+    from src.core.file_organizer import get_file_content
+    return get_file_content(file_info["abs_path"])
+
+
+def _iter_lines(text):
+    """
+    Yield the lines of a string one at a time, like text.split('\\n').
+    
+    Args:
+        text (str): Text to split
+        
+    Yields:
+        str: Lines without their newline
+    """
+    start = 0
+    while True:
+        end = text.find('\n', start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
 def extract_project_description(files_info):
     """
     Extract project description from README.md or other key files.
@@ -131,39 +175,39 @@ def extract_project_description(files_info):
     """
     description = ""
     
+    # Index the files by lowercased path in one pass; the first match wins
+    by_path = {}
+    for file_info in files_info:
+        by_path.setdefault(file_info["path"].lower(), file_info)
+    
     # First check for README.md
-    readme_files = [f for f in files_info if f["path"].lower() == "readme.md"]
-    if readme_files:
-        readme_content = readme_files[0].get("content", "")
-        # Extract first paragraph from README
+    readme_file = by_path.get("readme.md")
+    if readme_file:
+        readme_content = _read_file_content(readme_file)
+        # Extract first paragraph from README, reading lines lazily so a
+        # large README is not split up in full
         if readme_content:
-            lines = readme_content.split('\n')
+            lines = _iter_lines(readme_content)
+            first_line = next(lines)
             # Skip title if present
-            start_idx = 0
-            if lines and lines[0].startswith('# '):
-                start_idx = 1
+            if not first_line.startswith('# '):
+                lines = chain((first_line,), lines)
             
             # Collect lines until empty line
-            desc_lines = []
-            for i in range(start_idx, len(lines)):
-                if not lines[i].strip():
-                    break
-                desc_lines.append(lines[i])
+            desc_lines = list(takewhile(str.strip, lines))
             
             if desc_lines:
                 description = ' '.join(desc_lines)
     
     # If no description found in README, check setup.py
     if not description:
-        setup_files = [f for f in files_info if f["path"].lower() == "setup.py"]
-        if setup_files:
-            setup_content = setup_files[0].get("content", "")
-            # Try to extract description from setup.py
-            if "description=" in setup_content:
-                start = setup_content.find("description=") + len("description=")
-                end = setup_content.find(",", start)
-                if end > start:
-                    description = setup_content[start:end].strip('\'"')
+        setup_file = by_path.get("setup.py")
+        if setup_file:
+            setup_content = _read_file_content(setup_file)
+            # Try to extract a quoted description from setup.py
+            match = _SETUP_DESCRIPTION_PATTERN.search(setup_content)
+            if match:
+                description = match.group(2)
     
     return description
 
@@ -238,7 +282,24 @@ def format_structure(node, indent=0, exclude_dirs=None):
         # Default exclusions if none provided
         exclude_dirs = ['__pycache__/', 'venv/', '.venv/', 'node_modules/']
     
-    result = ""
+    # Collect the lines from a generator and join them once, instead of
+    # growing the result string node by node
+    return "".join(_format_structure_lines(node, indent, exclude_dirs))
+
+
+def _format_structure_lines(node, indent, exclude_dirs):
+    """
+    Yield the lines of a formatted structure node.
+    
+    Args:
+        node (dict): Structure node
+        indent (int): Current indentation level
+        exclude_dirs (list): List of directory paths to exclude
+        
+    Yields:
+        str: Formatted lines, each ending in a newline
+    """
+    pad = " " * indent
     
     if node["type"] == "directory":
         # Get the full path of the current node
@@ -248,13 +309,10 @@ def format_structure(node, indent=0, exclude_dirs=None):
         # 1. The directory name is in the exclude_dirs list
         # 2. The directory name starts with '__pycache__' or similar patterns
         if (any(excluded_dir in node_path for excluded_dir in exclude_dirs) or
-            node["name"] == "__pycache__" or
-            node["name"] == "venv" or
-            node["name"] == ".venv" or
-            node["name"] == "node_modules"):
-            return ""
+            node["name"] in _ALWAYS_HIDDEN_DIRS):
+            return
         
-        result += " " * indent + node["name"] + "/\n"
+        yield pad + node["name"] + "/\n"
         
         # Sort children: directories first, then files
         dirs = []
@@ -262,10 +320,7 @@ def format_structure(node, indent=0, exclude_dirs=None):
         for child in node.get("children", []):
             if child["type"] == "directory":
                 # Skip common directories that should be excluded
-                if (child["name"] == "__pycache__" or
-                    child["name"] == "venv" or
-                    child["name"] == ".venv" or
-                    child["name"] == "node_modules" or
+                if (child["name"] in _ALWAYS_HIDDEN_DIRS or
                     any(excluded_dir in child["name"] for excluded_dir in exclude_dirs)):
                     continue
                 dirs.append(child)
@@ -273,26 +328,21 @@ def format_structure(node, indent=0, exclude_dirs=None):
                 files.append(child)
         
         # Process directories first (sorted by name)
-        for child in sorted(dirs, key=lambda x: x["name"]):
-            child_result = format_structure(child, indent + 2, exclude_dirs)
-            # Only add the result if the child wasn't excluded
-            if child_result:
-                result += child_result
+        for child in sorted(dirs, key=_name_key):
+            yield from _format_structure_lines(child, indent + 2, exclude_dirs)
         
-        # Then process files (show up to 5 per directory)
-        for child in sorted(files, key=lambda x: x["name"])[:5]:
-            result += format_structure(child, indent + 2, exclude_dirs)
+        # Then process files (show up to 5 per directory, without sorting them all)
+        for child in heapq.nsmallest(5, files, key=_name_key):
+            yield from _format_structure_lines(child, indent + 2, exclude_dirs)
         
         # If there are more files, indicate with ellipsis
         if len(files) > 5:
-            result += " " * (indent + 2) + "...\n"
+            yield pad + "  ...\n"
     else:
         # Skip common excluded file patterns like .pyc
         if node["name"].endswith(".pyc") or node["name"].endswith(".pyo"):
-            return ""
-        result += " " * indent + node["name"] + "\n"
-    
-    return result
+            return
+        yield pad + node["name"] + "\n"
 
 
 def generate_readme(structure_data, files_info, project_name, exclude_dirs=None):
@@ -308,6 +358,28 @@ def generate_readme(structure_data, files_info, project_name, exclude_dirs=None)
     Returns:
         str: README.md content
     """
+    return "".join(iter_readme(structure_data, files_info, project_name, exclude_dirs))
+
+
+def iter_readme(structure_data, files_info, project_name, exclude_dirs=None):
+    """
+    Generate a README.md for Claude AI piece by piece.
+    
+    Args:
+        structure_data (dict): Project structure data
+        files_info (list): List of file information dictionaries
+        project_name (str): Name of the project
+        exclude_dirs (list, optional): List of directory paths to exclude
+        
+    Yields:
+        str: Consecutive chunks of the README.md content
+    """
+    if exclude_dirs is None:
+        # Default exclusions, as format_structure uses
+        structure_exclude_dirs = ['__pycache__/', 'venv/', '.venv/', 'node_modules/']
+    else:
+        structure_exclude_dirs = exclude_dirs
+    
     # Analyze project
     analysis = analyze_project_structure(structure_data, exclude_dirs)
     
@@ -325,7 +397,7 @@ def generate_readme(structure_data, files_info, project_name, exclude_dirs=None)
                 main_modules.append(dir_path)
     
     # Create the README content
-    readme = f"""# {project_name}
+    yield f"""# {project_name}
 
 {description}
 
@@ -334,7 +406,7 @@ def generate_readme(structure_data, files_info, project_name, exclude_dirs=None)
 This is an organized snapshot of the "{project_name}" project prepared for Claude AI.
 
 - **Total Files**: {analysis["total_files"]}
-- **Main Language**: {next(iter(analysis["file_types"]), "Unknown").replace('.', '')}
+- **Main Language**: {analysis["main_language"].replace('.', '')}
 - **Primary Modules**: {', '.join(main_modules) if main_modules else "No specific modules identified"}
 
 ## Key Files and Their Purpose
@@ -355,10 +427,10 @@ This is an organized snapshot of the "{project_name}" project prepared for Claud
     # Limit to top 10 most important files
     for file_info in important_files[:10]:
         purpose = suggest_file_purpose(file_info["path"])
-        readme += f"| `{file_info['path']}` | {purpose} |\n"
+        yield f"| `{file_info['path']}` | {purpose} |\n"
     
     # Add project structure section
-    readme += """
+    yield """
 ## Project Structure
 
 The project follows this structure (abbreviated):
@@ -367,11 +439,11 @@ The project follows this structure (abbreviated):
 """
     
     # Add simplified structure representation with exclusions
-    readme += format_structure(structure_data, exclude_dirs=exclude_dirs)
-    readme += "```\n\n"
+    yield from _format_structure_lines(structure_data, 0, structure_exclude_dirs)
+    yield "```\n\n"
     
     # Add token information
-    readme += f"""## Claude AI Information
+    yield f"""## Claude AI Information
 
 This project snapshot has been prepared for Claude AI assistance:
 
@@ -381,8 +453,6 @@ This project snapshot has been prepared for Claude AI assistance:
 
 Questions about specific files or functionalities are welcome!
 """
-    
-    return readme
 
 
 def save_readme(readme_content, output_path):
@@ -390,8 +460,12 @@ def save_readme(readme_content, output_path):
     Save README.md to the output directory.
     
     Args:
-        readme_content (str): README.md content
+        readme_content (str or iterable): README.md content, or chunks of it
+            as produced by iter_readme, which are written as they come
         output_path (str): Output directory path
     """
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(readme_content)
\ No newline at end of file
+        if isinstance(readme_content, str):
+            f.write(readme_content)
+        else:
+            f.writelines(readme_content)
\ No newline at end of file
@@ -4,8 +4,21 @@ Structure visualization generation for Claude AI File Organizer.
 
 import os
 import json
+from functools import lru_cache
 from pathlib import Path
 
+from src.core.exclusions import (
+    ALWAYS_EXCLUDE_DIRS, EXCLUDED_EXTENSIONS, STRUCTURE_EXCLUDE_DIRS,
+    compile_exclude_patterns, contains_excluded
+)
+from src.core.file_organizer import get_file_content
+
+# orjson is optional; it serializes large structures much faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def should_exclude_item(item_name, item_path=None, exclude_dirs=None):
     """
@@ -21,64 +34,55 @@ def should_exclude_item(item_name, item_path=None, exclude_dirs=None):
     """
     if exclude_dirs is None:
         # Default exclusions
-        exclude_dirs = [
-            # Python related
-            '__pycache__', '*.pyc', '*.pyo', '*.pyd', '*.so', '*.dll',
-            'venv', '.venv', 'env', '.env', 'virtualenv',
-            'dist', 'build', 'eggs', 'parts', 'bin', 'var',
-            'sdist', 'develop-eggs', '.installed.cfg', 'lib', 'lib64',
-            
-            # JavaScript/Node related
-            'node_modules', 'bower_components', '.npm', '.yarn',
-            
-            # Version control
-            '.git', '.hg', '.svn', '.cvs', '.bzr',
-            
-            # IDE and editors
-            '.idea', '.vscode', '*.swp', '*.swo', '*.swn', '*.bak',
-            
-            # OS specific
-            '.DS_Store', 'Thumbs.db', 'ehthumbs.db',
-            
-            # Project specific
-            'output', 'logs', 'temp', 'tmp', 'cache',
-            
-            # Package directories
-            'site-packages', '.pytest_cache'
-        ]
-    
-    # Common directories to always exclude
-    always_exclude = [
-        '__pycache__', 'venv', '.venv', 'node_modules', '.git', 
-        'dist', 'build', 'eggs', 'site-packages'
-    ]
+        exclude_dirs = STRUCTURE_EXCLUDE_DIRS
     
     # Always exclude these directories
-    if item_name in always_exclude:
+    if item_name in ALWAYS_EXCLUDE_DIRS:
         return True
         
     # Check file extensions for files
     if '.' in item_name:
-        excluded_extensions = ['.pyc', '.pyo', '.pyd', '.so', '.dll', '.exe']
         _, ext = os.path.splitext(item_name)
-        if ext.lower() in excluded_extensions:
+        if ext.lower() in EXCLUDED_EXTENSIONS:
             return True
             
-    # Check against exclude patterns
+    # Check against exclude patterns; the name is the tail of the full path,
+    # so one substring search over the path covers both
     if item_path:
-        full_path = os.path.join(item_path, item_name)
-        return any(
-            (exclude_pattern in full_path) or 
-            (exclude_pattern in item_name) or
-            (exclude_pattern == item_name)
-            for exclude_pattern in exclude_dirs
-        )
+        return contains_excluded(os.path.join(item_path, item_name), exclude_dirs)
     
-    return any(
-        (exclude_pattern in item_name) or
-        (exclude_pattern == item_name)
-        for exclude_pattern in exclude_dirs
-    )
+    return contains_excluded(item_name, exclude_dirs)
+
+
+@lru_cache(maxsize=8)
+def _make_entry_filter(exclude_dirs):
+    """
+    Build the check that decides whether a directory entry is left out of the structure.
+    
+    It combines the hidden-entry rule with should_exclude_item's checks, and
+    takes the extension by slicing from the last dot instead of os.path.splitext.
+    
+    Args:
+        exclude_dirs (tuple): Exclude patterns
+        
+    Returns:
+        callable: Function taking an entry name and its parent directory path,
+            returning True if the entry should be excluded
+    """
+    matcher = compile_exclude_patterns(exclude_dirs)
+    
+    def is_excluded(name, dir_path):
+        # Skip hidden files and directories (except .ignore) and always-excluded directories
+        if (name[0] == '.' and name != '.ignore') or name in ALWAYS_EXCLUDE_DIRS:
+            return True
+        
+        dot = name.rfind('.')
+        if dot > 0 and name[dot:].lower() in EXCLUDED_EXTENSIONS:
+            return True
+        
+        return matcher is not None and matcher(os.path.join(dir_path, name))
+    
+    return is_excluded
 
 
 def build_directory_structure(root_path, exclude_dirs=None):
@@ -99,20 +103,22 @@ def build_directory_structure(root_path, exclude_dirs=None):
         "children": []
     }
     
-    for item in sorted(os.listdir(root_path)):
-        item_path = os.path.join(root_path, item)
+    # scandir entries carry their type, so telling directories from files costs no extra stat
+    with os.scandir(root_path) as entries:
+        entries = sorted(entries, key=lambda entry: entry.name)
+    
+    is_excluded = _make_entry_filter(tuple(STRUCTURE_EXCLUDE_DIRS if exclude_dirs is None else exclude_dirs))
+    
+    for entry in entries:
+        item = entry.name
         
-        # Skip hidden files and directories (except .ignore)
-        if item.startswith('.') and item != '.ignore':
-            continue
-            
         # Check if item should be excluded
-        if should_exclude_item(item, root_path, exclude_dirs):
+        if is_excluded(item, root_path):
             continue
         
-        if os.path.isdir(item_path):
+        if entry.is_dir():
             # Recursively process directory
-            dir_structure = build_directory_structure(item_path, exclude_dirs)
+            dir_structure = build_directory_structure(entry.path, exclude_dirs)
             if dir_structure and dir_structure.get("children"):
                 structure["children"].append(dir_structure)
         else:
@@ -129,40 +135,34 @@ def add_file_content(structure, files_info):
     """
     Add file content to the structure for selected files.
     
+    The structure is updated in place rather than copied, since it is
+    built fresh for every export.
+    
     Args:
         structure (dict): Directory structure
         files_info (list): Selected files information
         
     Returns:
-        dict: Updated directory structure
+        dict: The same directory structure, updated
     """
-    # Create a dictionary for quick lookup of file paths
-    files_dict = {file_info['path'].replace('\\', '/'): file_info for file_info in files_info}
-    
-    def process_node(node, current_path=""):
-        """Process a node in the structure tree."""
+    # Map each selected file's path, normalized to '/' once here, to where it lives on disk
+    abs_paths = {file_info['path'].replace('\\', '/'): file_info['abs_path'] for file_info in files_info}
+    
+    # Process the structure with an explicit stack instead of recursion; paths
+    # are built with '/' directly so they match the keys without normalizing
+    stack = [(structure, "")]
+    while stack:
+        node, current_path = stack.pop()
+        node_path = f"{current_path}/{node['name']}" if current_path else node["name"]
+        
         if node["type"] == "directory":
             # Process directory
-            dir_path = os.path.join(current_path, node["name"]) if current_path else node["name"]
-            
-            for child in node.get("children", []):
-                process_node(child, dir_path)
-        else:
-            # Process file
-            file_path = os.path.join(current_path, node["name"]).replace('\\', '/')
-            
-            if file_path in files_dict:
-                # Add file content for selected files
-                node["content"] = files_dict[file_path]["content"]
-    
-    # Make a deep copy of the structure to avoid modifying the original
-    import copy
-    structure_copy = copy.deepcopy(structure)
+            stack.extend((child, node_path) for child in node.get("children", []))
+        elif node_path in abs_paths:
+            # Add file content for selected files, read from disk only now
+            node["content"] = get_file_content(abs_paths[node_path])
     
-    # Process the structure
-    process_node(structure_copy)
-    
-    return structure_copy
+    return structure
 
 
 def generate_structure(root_path, selected_files, exclude_dirs=None):
@@ -177,14 +177,27 @@ def generate_structure(root_path, selected_files, exclude_dirs=None):
     Returns:
         str: JSON string of the structure
     """
+    # Convert to JSON
+    return json.dumps(build_structure(root_path, selected_files, exclude_dirs), indent=2, ensure_ascii=False)
+
+
+def build_structure(root_path, selected_files, exclude_dirs=None):
+    """
+    Build the project structure with file content, without serializing it.
+    
+    Args:
+        root_path (str): Root directory path
+        selected_files (list): Selected files information
+        exclude_dirs (list, optional): List of directory patterns to exclude
+        
+    Returns:
+        dict: Directory structure with content for the selected files
+    """
     # Build directory structure
     structure = build_directory_structure(root_path, exclude_dirs)
     
     # Add file content for selected files
-    structure_with_content = add_file_content(structure, selected_files)
-    
-    # Convert to JSON
-    return json.dumps(structure_with_content, indent=2)
+    return add_file_content(structure, selected_files)
 
 
 def save_structure(structure, output_path):
@@ -196,4 +209,24 @@ def save_structure(structure, output_path):
         output_path (str): Output file path
     """
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(structure)
\ No newline at end of file
+        f.write(structure)
+
+
+def write_structure(structure, output_path):
+    """
+    Serialize a structure straight into a JSON file.
+    
+    Unlike save_structure, no intermediate JSON string is built: orjson's
+    bytes are written as they are, and the json fallback streams to the file.
+    
+    Args:
+        structure (dict): Directory structure
+        output_path (str): Output file path
+    """
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(structure, option=orjson.OPT_INDENT_2))
+        return
+    
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(structure, f, indent=2, ensure_ascii=False)
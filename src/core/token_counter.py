@@ -4,8 +4,22 @@ Token counting functionality for Claude AI File Organizer.
 
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 
+# Files are tokenized in chunks of about this many characters
+TOKEN_CHUNK_SIZE = 64 * 1024
+
+# Patterns for the simple token estimate
+_WORD_PATTERN = re.compile(r'\w+')
+_SPECIAL_CHAR_PATTERN = re.compile(r'[^\w\s]')
+
+# Token counts of files read so far, keyed by (abs_path, mtime_ns, size)
+_FILE_TOKEN_CACHE = {}
+
+
+@lru_cache(maxsize=None)
 def has_tiktoken():
     """Check if tiktoken is available."""
     try:
@@ -16,6 +30,28 @@ def has_tiktoken():
         return False
 
 
+@lru_cache(maxsize=None)
+def _get_tiktoken_encoding():
+    """
+    Load the tiktoken encoding once; building its BPE tables is expensive.
+    
+    Returns:
+        tiktoken.Encoding: Encoding to count tokens with, or None if tiktoken is not installed
+    """
+    try:
+        # Import tiktoken only when the function is called and only if it's available
+        import tiktoken
+    except ImportError:
+        return None
+    
+    # Use Claude's encoding (cl100k_base is close to Claude's tokenizer)
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # Fall back to simpler encoding if cl100k_base not available
+        return tiktoken.encoding_for_model("gpt-3.5-turbo")
+
+
 def estimate_tokens_tiktoken(content):
     """
     Estimate tokens using tiktoken library (more accurate).
@@ -26,21 +62,12 @@ def estimate_tokens_tiktoken(content):
     Returns:
         int: Estimated token count
     """
-    try:
-        # Import tiktoken only when the function is called and only if it's available
-        import tiktoken
-        
-        # Use Claude's encoding (cl100k_base is close to Claude's tokenizer)
-        try:
-            encoding = tiktoken.get_encoding("cl100k_base")
-            return len(encoding.encode(content))
-        except Exception:
-            # Fall back to simpler encoding if cl100k_base not available
-            encoding = tiktoken.encoding_for_model("gpt-3.5-turbo")
-            return len(encoding.encode(content))
-    except ImportError:
+    encoding = _get_tiktoken_encoding()
+    if encoding is None:
         # If import fails, fall back to the simple method
         return estimate_tokens_simple(content)
+    
+    return len(encoding.encode(content))
 
 
 def estimate_tokens_simple(content):
@@ -56,15 +83,16 @@ def estimate_tokens_simple(content):
     Returns:
         int: Estimated token count
     """
-    # Simple token estimation by splitting on whitespace and punctuation
-    tokens = re.findall(r'\w+|[^\w\s]', content)
+    # Simple token estimation by splitting on whitespace and punctuation:
+    # every word and every punctuation character is a token
+    words = len(_WORD_PATTERN.findall(content))
+    special_chars = len(_SPECIAL_CHAR_PATTERN.findall(content))
     
     # Count special tokens
-    code_blocks = len(re.findall(r'```', content))
-    special_chars = len(re.findall(r'[^\w\s]', content))
+    code_blocks = content.count('```')
     
     # Approximate calculation
-    return len(tokens) + code_blocks + (special_chars // 2)
+    return words + special_chars + code_blocks + (special_chars // 2)
 
 
 def estimate_tokens(content):
@@ -83,10 +111,72 @@ def estimate_tokens(content):
         return estimate_tokens_simple(content)
 
 
+def _last_token_boundary(chunk):
+    """
+    Find the last position in a chunk where the text can be split safely.
+    
+    A newline followed by a non-whitespace character ends every token that
+    tiktoken's pattern can build (trailing punctuation absorbs newlines, and
+    runs of whitespace absorb indentation), so counting the two sides
+    separately gives the same total as counting them together.
+    
+    Args:
+        chunk (str): Text read from a file
+        
+    Returns:
+        int: Index just after the newline, or 0 if there is no safe boundary
+    """
+    pos = chunk.rfind('\n', 0, len(chunk) - 1)
+    while pos != -1 and chunk[pos + 1].isspace():
+        pos = chunk.rfind('\n', 0, pos)
+    return pos + 1
+
+
+def _estimate_stream_tokens(f):
+    """
+    Estimate tokens for an open text file, reading it in chunks.
+    
+    Text is counted in pieces that end on a safe token boundary. With
+    tiktoken the total is exactly the count of the whole file; the simple
+    estimate rounds each piece separately, so it can be off by at most one
+    token per chunk. Chunks without a boundary are kept in a list and joined
+    only once a boundary turns up.
+    
+    Args:
+        f (file object): Text file opened for reading
+        
+    Returns:
+        int: Estimated token count
+    """
+    total_tokens = 0
+    pending = []
+    chunk = f.read(TOKEN_CHUNK_SIZE)
+    
+    # Split a chunk only once more text is known to follow, so a file that
+    # fits in a single chunk is always counted in one piece
+    for next_chunk in iter(lambda: f.read(TOKEN_CHUNK_SIZE), ""):
+        # Hold back the text after the last boundary so no token spans two pieces
+        cut = _last_token_boundary(chunk)
+        if cut:
+            pending.append(chunk[:cut])
+            total_tokens += estimate_tokens(''.join(pending))
+            pending = [chunk[cut:]]
+        else:
+            pending.append(chunk)
+        chunk = next_chunk
+    
+    pending.append(chunk)
+    return total_tokens + estimate_tokens(''.join(pending))
+
+
 def estimate_file_tokens(file_path):
     """
     Estimate tokens for a file.
     
+    The file is read and tokenized in chunks that end on a token boundary,
+    so memory use stays bounded for ordinary source and text files. Counts are
+    remembered until the file's modification time or size changes.
+    
     Args:
         file_path (str): Path to the file
         
@@ -94,13 +184,61 @@ def estimate_file_tokens(file_path):
         int: Estimated token count or 0 if file cannot be read
     """
     try:
+        file_stat = os.stat(file_path)
+        cache_key = (os.path.abspath(file_path), file_stat.st_mtime_ns, file_stat.st_size)
+        if cache_key in _FILE_TOKEN_CACHE:
+            return _FILE_TOKEN_CACHE[cache_key]
+        
         with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return estimate_tokens(content)
+            total_tokens = _estimate_stream_tokens(f)
+        
+        _FILE_TOKEN_CACHE[cache_key] = total_tokens
+        return total_tokens
     except (UnicodeDecodeError, IOError, OSError):
         return 0
 
 
+def estimate_many_file_tokens(file_paths):
+    """
+    Estimate tokens for many files at once.
+    
+    Files are read and tokenized in a thread pool. Threads are enough here:
+    besides the file reads, tiktoken's encode runs in its Rust extension
+    without holding the GIL. Files that were counted before are answered
+    from the cache, and the pool is skipped when none are left.
+    
+    Args:
+        file_paths (list): Paths to the files
+        
+    Returns:
+        dict: Estimated token count by file path
+    """
+    token_counts = {}
+    pending = []
+    
+    for file_path in file_paths:
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            token_counts[file_path] = 0
+            continue
+        
+        cache_key = (os.path.abspath(file_path), file_stat.st_mtime_ns, file_stat.st_size)
+        if cache_key in _FILE_TOKEN_CACHE:
+            token_counts[file_path] = _FILE_TOKEN_CACHE[cache_key]
+        else:
+            pending.append(file_path)
+    
+    if len(pending) == 1:
+        token_counts[pending[0]] = estimate_file_tokens(pending[0])
+    elif pending:
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(pending))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            token_counts.update(zip(pending, executor.map(estimate_file_tokens, pending)))
+    
+    return token_counts
+
+
 def estimate_filename_tokens(filename):
     """
     Estimate tokens for a filename.
@@ -125,9 +263,7 @@ def estimate_structure_tokens(files_info):
     Returns:
         int: Estimated token count for structure
     """
-    # Estimate tokens needed to represent the file structure
-    structure_text = ""
-    for file_info in files_info:
-        structure_text += f"{file_info['path']}\n"
+    # Estimate tokens needed to represent the file structure, one path per line
+    structure_text = "".join(f"{file_info['path']}\n" for file_info in files_info)
     
     return estimate_tokens(structure_text)
\ No newline at end of file
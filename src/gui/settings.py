@@ -7,18 +7,109 @@ import os
 import sys
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-import configparser
-from pathlib import Path
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # Ensure the proper module path is set
 script_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(script_dir))  # Go up two levels to project root
-sys.path.insert(0, project_root)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
-# Now import project modules
-from src.utils.config import load_config, create_default_config
-from src.utils.ignore import create_default_ignore
+# Starting folder for the project browser, looked up once
+home_dir = os.path.expanduser("~")
+
+# Fixed locations under the project root
+config_file_path = os.path.join(project_root, "config.ini")
+default_output_dir = os.path.join(project_root, "output")
+default_important_files_path = os.path.join(project_root, "important_files.txt")
+main_script_path = os.path.join(project_root, "src", "main.py")
+
+# Prefix of paths inside the project root; the trailing separator stops
+# /home/a from matching /home/alice
+project_root_prefix = os.path.join(project_root, "")
+
+# Project modules and subprocess are imported where they are used, so the
+# window comes up without loading them first
+
+
+def _resolve_path(path):
+    """
+    Resolve a settings path against the project root.
+    
+    Args:
+        path (str): Absolute path, or path relative to the project root
+        
+    Returns:
+        str: Absolute path
+    """
+    return path if os.path.isabs(path) else os.path.join(project_root, path)
+
+
+@lru_cache(maxsize=None)
+def _get_folder_opener():
+    """
+    Pick the function that opens a folder in this platform's file explorer.
+    
+    Returns:
+        callable: Function taking a folder path
+    """
+    if sys.platform == 'win32':
+        return os.startfile
+    
+    import subprocess
+    if sys.platform == 'darwin':  # macOS
+        return lambda path: subprocess.call(['open', path])
+    return lambda path: subprocess.call(['xdg-open', path])  # Linux
+
+
+def _ensure_config_assets():
+    """Create config.ini and the ignore file it names with default content if they are missing."""
+    from src.utils.config import load_config, create_default_config
+    from src.utils.ignore import create_default_ignore
+    
+    try:
+        config = load_config(config_file_path)
+    except FileNotFoundError:
+        create_default_config(config_file_path)
+        config = load_config(config_file_path)
+    
+    # Does nothing if the ignore file already exists
+    create_default_ignore(os.path.join(project_root, config['settings'].get('ignore', '.ignore')))
+
+
+def _read_text_file(path, create_default):
+    """
+    Read a text file, creating it with default content first if it is missing.
+    
+    Args:
+        path (str): Path to the file
+        create_default (callable): Function that writes the default file to a path
+        
+    Returns:
+        str: File content
+    """
+    # Opening the file is the existence check, so an existing file costs no extra stat
+    try:
+        f = open(path, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        create_default(path)
+        f = open(path, 'r', encoding='utf-8')
+    
+    with f:
+        return f.read()
+
+
+def _write_text_files(files):
+    """
+    Write text files.
+    
+    Args:
+        files (list): (path, content) pairs
+    """
+    for path, content in files:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
 
 
 class SettingsGUI:
@@ -31,23 +122,36 @@ class SettingsGUI:
         self.root.geometry("750x650")
         self.root.resizable(True, True)
         
-        # Load config or create default if not exists
-        self.config_path = os.path.join(project_root, "config.ini")
-        if not os.path.exists(self.config_path):
-            create_default_config(self.config_path)
-        
+        # Load config; main() creates the default files before the window is built
+        from src.utils.config import load_config
+        self.config_path = config_file_path
         self.config = load_config(self.config_path)
-        
-        # Create ignore file if not exists
         self.ignore_path = os.path.join(project_root, self.config['settings'].get('ignore', '.ignore'))
-        if not os.path.exists(self.ignore_path):
-            create_default_ignore(self.ignore_path)
+        
+        # Values as last saved, to skip writing the file when nothing changed
+        self._saved_config = self._snapshot_config()
         
         # Get important files path
-        self.important_files_path = self.config['settings'].get('important_files_path', 'important_files.txt')
         # Convert to absolute path if relative
-        if not os.path.isabs(self.important_files_path):
-            self.important_files_path = os.path.join(project_root, self.important_files_path)
+        self.important_files_path = _resolve_path(
+            self.config['settings'].get('important_files_path', 'important_files.txt')
+        )
+        
+        # The editor files are read and written on a worker thread so a slow
+        # disk never freezes the window
+        self._io_executor = ThreadPoolExecutor(max_workers=2)
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        
+        # Editor loads (and the save before a run) still going; the buttons that
+        # write the editor files stay disabled until they finish, so a
+        # half-loaded editor is never saved
+        self._pending_editor_io = 0
+        self._editor_save_buttons = []
+        
+        # Organizer process started by run_organizer, if any, and the
+        # environment it runs with
+        self._organizer_process = None
+        self._child_env = dict(os.environ, PYTHONPATH=project_root)
         
         self.create_widgets()
     
@@ -56,33 +160,41 @@ class SettingsGUI:
         # Main frame
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.pack(fill=tk.BOTH, expand=True)
+        self.main_frame = main_frame
         
         # Create notebook for tabs
         notebook = ttk.Notebook(main_frame)
         notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        # Create tabs
-        general_tab = ttk.Frame(notebook)
-        importance_tab = ttk.Frame(notebook)
-        api_tab = ttk.Frame(notebook)
-        file_editors_tab = ttk.Frame(notebook)  # New tab for file editors
+        # Create tabs; each tab frame carries the padding, so the tab builders
+        # lay out their widgets directly in it
+        general_tab = ttk.Frame(notebook, padding="10")
+        importance_tab = ttk.Frame(notebook, padding="10")
+        api_tab = ttk.Frame(notebook, padding="10")
+        file_editors_tab = ttk.Frame(notebook, padding="10")  # New tab for file editors
         
         notebook.add(general_tab, text="General Settings")
         notebook.add(importance_tab, text="File Importance")
         notebook.add(api_tab, text="API Settings")
         notebook.add(file_editors_tab, text="File Editors")  # Add the new tab
         
-        # General Settings Tab
-        self.create_general_settings(general_tab)
-        
-        # File Importance Tab
-        self.create_importance_settings(importance_tab)
-        
-        # API Settings Tab
-        self.create_api_settings(api_tab)
-        
-        # File Editors Tab (New)
-        self.create_file_editors(file_editors_tab)
+        # Tab contents are built the first time each tab is shown, so the file
+        # editors only read their files from disk once the user opens them
+        self.notebook = notebook
+        self._importance_tab = importance_tab
+        self._api_tab = api_tab
+        self._file_editors_tab = file_editors_tab
+        self._tab_builders = {
+            str(general_tab): (self.create_general_settings, general_tab),
+            str(importance_tab): (self.create_importance_settings, importance_tab),
+            str(api_tab): (self.create_api_settings, api_tab),
+            str(file_editors_tab): (self.create_file_editors, file_editors_tab)
+        }
+        self._built_tabs = set()
+        
+        # General Settings Tab is shown first; the other tabs read its values
+        self._build_tab(str(general_tab))
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
         # Buttons Frame
         buttons_frame = ttk.Frame(main_frame)
@@ -95,63 +207,75 @@ class SettingsGUI:
         # Run Button
         run_button = ttk.Button(buttons_frame, text="Save & Run Organizer", command=self.run_organizer)
         run_button.pack(side=tk.RIGHT, padx=5)
+        self._editor_save_buttons.append(run_button)
+    
+    def _build_tab(self, tab_name):
+        """Build a tab's widgets unless they have been built already."""
+        if tab_name in self._built_tabs or tab_name not in self._tab_builders:
+            return
+        
+        self._built_tabs.add(tab_name)
+        builder, tab = self._tab_builders[tab_name]
+        builder(tab)
+    
+    def _on_tab_changed(self, event):
+        """Build the selected tab's widgets the first time it is shown."""
+        self._build_tab(str(self.notebook.select()))
+    
+    def _tab_built(self, tab):
+        """Check whether a tab's widgets have been built."""
+        return str(tab) in self._built_tabs
+    
+    def _build_path_row(self, frame, row, label, browse_command, variable=None):
+        """
+        Add a labelled path entry with a Browse button to a settings grid.
+        
+        Args:
+            frame (ttk.Frame): Frame laid out with grid
+            row (int): Grid row to use
+            label (str): Label text
+            browse_command (callable): Command for the Browse button
+            variable (tk.StringVar, optional): Variable bound to the entry
+            
+        Returns:
+            ttk.Entry: The path entry
+        """
+        ttk.Label(frame, text=label).grid(row=row, column=0, sticky=tk.W, pady=5)
+        
+        # Entry and button go straight into the grid; no per-row wrapper frame
+        if variable is not None:
+            entry = ttk.Entry(frame, textvariable=variable, width=40)
+        else:
+            entry = ttk.Entry(frame, width=40)
+        entry.grid(row=row, column=1, sticky=tk.EW, pady=5)
+        
+        browse_button = ttk.Button(frame, text="Browse...", command=browse_command)
+        browse_button.grid(row=row, column=2, padx=5, pady=5)
+        
+        return entry
     
     def create_general_settings(self, parent):
         """Create general settings widgets."""
-        # Create frame with padding
-        frame = ttk.Frame(parent, padding="10")
-        frame.pack(fill=tk.BOTH, expand=True)
+        # The tab frame is already padded
+        frame = parent
         
         # Project Path
-        ttk.Label(frame, text="Project Path:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        
-        path_frame = ttk.Frame(frame)
-        path_frame.grid(row=0, column=1, sticky=tk.EW, pady=5)
-        
         self.project_path_var = tk.StringVar(value=self.config['settings'].get('path', ''))
-        project_path_entry = ttk.Entry(path_frame, textvariable=self.project_path_var, width=40)
-        project_path_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        browse_button = ttk.Button(path_frame, text="Browse...", command=self.browse_project_path)
-        browse_button.pack(side=tk.RIGHT, padx=5)
+        self._build_path_row(frame, 0, "Project Path:", self.browse_project_path, self.project_path_var)
         
         # Output Directory
-        ttk.Label(frame, text="Output Directory:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        
-        output_dir_frame = ttk.Frame(frame)
-        output_dir_frame.grid(row=1, column=1, sticky=tk.EW, pady=5)
-        
         self.output_dir_var = tk.StringVar(value=self.config['settings'].get('output_dir', 'output'))
-        output_dir_entry = ttk.Entry(output_dir_frame, textvariable=self.output_dir_var, width=40)
-        output_dir_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        output_dir_browse = ttk.Button(output_dir_frame, text="Browse...", command=self.browse_output_dir)
-        output_dir_browse.pack(side=tk.RIGHT, padx=5)
+        self._build_path_row(frame, 1, "Output Directory:", self.browse_output_dir, self.output_dir_var)
         
         # Ignore File
-        ttk.Label(frame, text="Ignore File:").grid(row=2, column=0, sticky=tk.W, pady=5)
-        
-        ignore_frame = ttk.Frame(frame)
-        ignore_frame.grid(row=2, column=1, sticky=tk.EW, pady=5)
-        
         self.ignore_file_var = tk.StringVar(value=self.config['settings'].get('ignore', '.ignore'))
-        ignore_file_entry = ttk.Entry(ignore_frame, textvariable=self.ignore_file_var, width=40)
-        ignore_file_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        ignore_browse = ttk.Button(ignore_frame, text="Browse...", command=self.browse_ignore_file)
-        ignore_browse.pack(side=tk.RIGHT, padx=5)
+        self._build_path_row(frame, 2, "Ignore File:", self.browse_ignore_file, self.ignore_file_var)
         
         # Important Files Path
-        ttk.Label(frame, text="Important Files List:").grid(row=3, column=0, sticky=tk.W, pady=5)
-        
-        important_files_frame = ttk.Frame(frame)
-        important_files_frame.grid(row=3, column=1, sticky=tk.EW, pady=5)
-        
         # Determine the default important files path
         default_file = 'important_files.txt'
-        default_path = os.path.join(project_root, default_file)
         
-        if os.path.exists(default_path):
+        if os.path.exists(default_important_files_path):
             # If the file exists in project root, use it (relative path form)
             important_files_path = default_file
         else:
@@ -159,13 +283,10 @@ class SettingsGUI:
             important_files_path = self.config['settings'].get('important_files_path', default_file)
             
         # Create the entry directly with a plain string value (not using StringVar)
-        self.important_files_entry = ttk.Entry(important_files_frame, width=40)
+        self.important_files_entry = self._build_path_row(
+            frame, 3, "Important Files List:", self.browse_important_files
+        )
         self.important_files_entry.insert(0, important_files_path)  # Insert the text directly
-        self.important_files_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        important_files_browse = ttk.Button(important_files_frame, text="Browse...", 
-                                            command=self.browse_important_files)
-        important_files_browse.pack(side=tk.RIGHT, padx=5)
         
         # Max Tokens
         ttk.Label(frame, text="Max Tokens:").grid(row=4, column=0, sticky=tk.W, pady=5)
@@ -200,40 +321,38 @@ class SettingsGUI:
     
     def create_importance_settings(self, parent):
         """Create file importance settings widgets."""
-        # Create frame with padding
-        frame = ttk.Frame(parent, padding="10")
-        frame.pack(fill=tk.BOTH, expand=True)
+        # The tab frame is already padded
+        frame = parent
+        
+        # The values are single comma-separated lines, so plain entries are enough
         
         # Important Formats
-        ttk.Label(frame, text="Important File Formats:").grid(row=0, column=0, sticky=tk.NW, pady=5)
+        ttk.Label(frame, text="Important File Formats:").grid(row=0, column=0, sticky=tk.W, pady=5)
         
-        self.important_formats_var = tk.StringVar(value=self.config['file_importance'].get('important_formats', ''))
-        important_formats_text = tk.Text(frame, height=4, width=40, wrap=tk.WORD)
-        important_formats_text.grid(row=0, column=1, sticky=tk.EW, pady=5)
-        important_formats_text.insert(tk.END, self.important_formats_var.get())
-        self.important_formats_text = important_formats_text
+        important_formats_entry = ttk.Entry(frame, width=40)
+        important_formats_entry.grid(row=0, column=1, sticky=tk.EW, pady=5)
+        important_formats_entry.insert(0, self.config['file_importance'].get('important_formats', ''))
+        self.important_formats_entry = important_formats_entry
         
         ttk.Label(frame, text="(Comma-separated list of file extensions, e.g. .py,.md,.txt)").grid(row=1, column=1, sticky=tk.W, pady=0)
         
         # Important Files
-        ttk.Label(frame, text="Important Files:").grid(row=2, column=0, sticky=tk.NW, pady=5)
+        ttk.Label(frame, text="Important Files:").grid(row=2, column=0, sticky=tk.W, pady=5)
         
-        self.important_files_var = tk.StringVar(value=self.config['file_importance'].get('important_files', ''))
-        important_files_text = tk.Text(frame, height=4, width=40, wrap=tk.WORD)
-        important_files_text.grid(row=2, column=1, sticky=tk.EW, pady=5)
-        important_files_text.insert(tk.END, self.important_files_var.get())
-        self.important_files_text = important_files_text
+        important_names_entry = ttk.Entry(frame, width=40)
+        important_names_entry.grid(row=2, column=1, sticky=tk.EW, pady=5)
+        important_names_entry.insert(0, self.config['file_importance'].get('important_files', ''))
+        self.important_names_entry = important_names_entry
         
         ttk.Label(frame, text="(Comma-separated list of filenames, e.g. README.md,setup.py)").grid(row=3, column=1, sticky=tk.W, pady=0)
         
         # Important Paths
-        ttk.Label(frame, text="Important Paths:").grid(row=4, column=0, sticky=tk.NW, pady=5)
+        ttk.Label(frame, text="Important Paths:").grid(row=4, column=0, sticky=tk.W, pady=5)
         
-        self.important_paths_var = tk.StringVar(value=self.config['file_importance'].get('important_paths', ''))
-        important_paths_text = tk.Text(frame, height=4, width=40, wrap=tk.WORD)
-        important_paths_text.grid(row=4, column=1, sticky=tk.EW, pady=5)
-        important_paths_text.insert(tk.END, self.important_paths_var.get())
-        self.important_paths_text = important_paths_text
+        important_paths_entry = ttk.Entry(frame, width=40)
+        important_paths_entry.grid(row=4, column=1, sticky=tk.EW, pady=5)
+        important_paths_entry.insert(0, self.config['file_importance'].get('important_paths', ''))
+        self.important_paths_entry = important_paths_entry
         
         ttk.Label(frame, text="(Comma-separated list of directory paths, e.g. src/,docs/)").grid(row=5, column=1, sticky=tk.W, pady=0)
         
@@ -242,9 +361,8 @@ class SettingsGUI:
     
     def create_api_settings(self, parent):
         """Create API settings widgets."""
-        # Create frame with padding
-        frame = ttk.Frame(parent, padding="10")
-        frame.pack(fill=tk.BOTH, expand=True)
+        # The tab frame is already padded
+        frame = parent
         
         # Extract Endpoints
         ttk.Label(frame, text="Extract API Endpoints:").grid(row=0, column=0, sticky=tk.W, pady=5)
@@ -285,9 +403,8 @@ class SettingsGUI:
     
     def create_file_editors(self, parent):
         """Create file editors tab for editing .ignore and important_files.txt."""
-        # Main frame for the tab
-        frame = ttk.Frame(parent, padding="10")
-        frame.pack(fill=tk.BOTH, expand=True)
+        # The tab frame is already padded
+        frame = parent
         
         # Create a notebook for the two editors
         editors_notebook = ttk.Notebook(frame)
@@ -313,6 +430,8 @@ class SettingsGUI:
         # Save Files Button
         save_files_button = ttk.Button(buttons_frame, text="Save Files", command=self.save_editor_files)
         save_files_button.pack(side=tk.RIGHT, padx=5)
+        self._editor_save_buttons.append(save_files_button)
+        self._update_editor_save_buttons()
         
         # Reload Files Button
         reload_files_button = ttk.Button(buttons_frame, text="Reload Files", command=self.reload_editor_files)
@@ -363,105 +482,194 @@ class SettingsGUI:
         # Load the current important_files.txt content
         self.load_important_files()
     
-    def load_ignore_file(self):
-        """Load the content of the .ignore file into the editor."""
+    def _ignore_file_path(self):
+        """Get the absolute path of the ignore file from the settings."""
+        return _resolve_path(self.ignore_file_var.get())
+    
+    def _important_files_list_path(self):
+        """Get the absolute path of the important files list from the settings."""
+        return _resolve_path(self.important_files_entry.get())
+    
+    def _run_io(self, job, on_done, error_message, on_finish=None):
+        """
+        Run a file job on the I/O thread and hand its result back to the Tk thread.
+        
+        Args:
+            job (callable): Function doing the file I/O
+            on_done (callable): Called on the Tk thread with the job's result
+            error_message (str): Message shown if the job fails
+            on_finish (callable, optional): Called on the Tk thread afterwards,
+                whether the job succeeded or not
+        """
+        self._hand_back(self._io_executor.submit(job), on_done, error_message, on_finish)
+    
+    def _hand_back(self, future, on_done, error_message, on_finish=None):
+        """Handle a file job's result on the Tk thread once it is done."""
+        self._when_done([future], lambda: self._finish_io(future, on_done, error_message, on_finish))
+    
+    def _when_done(self, futures, callback):
+        """
+        Call back on the Tk thread once all futures are done.
+        
+        The futures are polled with root.after rather than given done
+        callbacks, since those run on the worker thread and Tk must only be
+        used from the thread running the main loop.
+        
+        Args:
+            futures (list): Futures to wait for
+            callback (callable): Called without arguments when they are all done
+        """
+        if all(future.done() for future in futures):
+            callback()
+        else:
+            self.root.after(50, self._when_done, futures, callback)
+    
+    def _finish_io(self, future, on_done, error_message, on_finish=None):
+        """Pass a finished file job's result on, or report its error."""
         try:
-            # Get the ignore file path from the config
-            ignore_path = self.ignore_file_var.get()
-            
-            # Convert to absolute path if it's relative
-            if not os.path.isabs(ignore_path):
-                ignore_path = os.path.join(project_root, ignore_path)
+            try:
+                result = future.result()
+            except Exception as e:
+                messagebox.showerror("Error", f"{error_message}: {e}")
+                return
             
-            # Check if the file exists
-            if os.path.exists(ignore_path):
-                with open(ignore_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Clear the editor and insert the content
-                self.ignore_editor.delete(1.0, tk.END)
-                self.ignore_editor.insert(tk.END, content)
-            else:
-                # If the file doesn't exist, create a default one
-                from src.utils.ignore import create_default_ignore
-                create_default_ignore(ignore_path)
-                
-                # Load the newly created default file
-                with open(ignore_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                self.ignore_editor.delete(1.0, tk.END)
-                self.ignore_editor.insert(tk.END, content)
-        except Exception as e:
-            messagebox.showerror("Error", f"Error loading .ignore file: {e}")
+            on_done(result)
+        finally:
+            if on_finish is not None:
+                on_finish()
+    
+    def _begin_editor_io(self):
+        """Note that editor file I/O has started and disable saving the editors."""
+        self._pending_editor_io += 1
+        self._update_editor_save_buttons()
+    
+    def _end_editor_io(self):
+        """Note that editor file I/O has finished and re-enable saving once none is left."""
+        self._pending_editor_io -= 1
+        self._update_editor_save_buttons()
+    
+    def _update_editor_save_buttons(self):
+        """Enable the buttons that write the editor files only while no editor I/O is running."""
+        state = tk.DISABLED if self._pending_editor_io else tk.NORMAL
+        for button in self._editor_save_buttons:
+            button.configure(state=state)
+    
+    def _set_editor_content(self, editor, content):
+        """Replace the text in an editor as a single edit."""
+        editor.configure(state=tk.NORMAL, autoseparators=False)
+        editor.mark_set(tk.INSERT, '1.0')
+        editor.delete('1.0', tk.END)
+        editor.insert('1.0', content)
+        
+        # Loaded content is the starting point, not an undoable change
+        editor.edit_reset()
+        editor.edit_modified(False)
+        editor.configure(autoseparators=True)
+    
+    def load_ignore_file(self):
+        """Load the content of the .ignore file into the editor."""
+        from src.utils.ignore import create_default_ignore
+        
+        # Get the ignore file path from the config
+        ignore_path = self._ignore_file_path()
+        
+        self._begin_editor_io()
+        self._run_io(
+            lambda: _read_text_file(ignore_path, create_default_ignore),
+            lambda content: self._set_editor_content(self.ignore_editor, content),
+            "Error loading .ignore file",
+            self._end_editor_io
+        )
     
     def load_important_files(self):
         """Load the content of the important_files.txt file into the editor."""
-        try:
-            # Get the important files path from the entry
-            important_files_path = self.important_files_entry.get()
-            
-            # Convert to absolute path if it's relative
-            if not os.path.isabs(important_files_path):
-                important_files_path = os.path.join(project_root, important_files_path)
-            
-            # Check if the file exists
-            if os.path.exists(important_files_path):
-                with open(important_files_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Clear the editor and insert the content
-                self.important_files_editor.delete(1.0, tk.END)
-                self.important_files_editor.insert(tk.END, content)
-            else:
-                # If the file doesn't exist, create a default one
-                from src.utils.config import create_default_important_files
-                create_default_important_files(important_files_path)
-                
-                # Load the newly created default file
-                with open(important_files_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                self.important_files_editor.delete(1.0, tk.END)
-                self.important_files_editor.insert(tk.END, content)
-        except Exception as e:
-            messagebox.showerror("Error", f"Error loading important_files.txt: {e}")
+        from src.utils.config import create_default_important_files
+        
+        # Get the important files path from the entry
+        important_files_path = self._important_files_list_path()
+        
+        self._begin_editor_io()
+        self._run_io(
+            lambda: _read_text_file(important_files_path, create_default_important_files),
+            lambda content: self._set_editor_content(self.important_files_editor, content),
+            "Error loading important_files.txt",
+            self._end_editor_io
+        )
+    
+    def _submit_editor_save(self):
+        """
+        Start writing both editors to their files on the I/O thread.
+        
+        Returns:
+            Future: The pending write, or None if the editors were never opened
+        """
+        # Nothing to save if the editors were never opened
+        if not self._tab_built(self._file_editors_tab):
+            return None
+        
+        # Widget contents are read here, on the Tk thread
+        files = [
+            # 'end-1c' leaves out the newline Tk keeps after the last line, which
+            # would otherwise be added to the file on every save
+            (self._ignore_file_path(), self.ignore_editor.get('1.0', 'end-1c')),
+            (self._important_files_list_path(), self.important_files_editor.get('1.0', 'end-1c'))
+        ]
+        return self._io_executor.submit(_write_text_files, files)
     
     def save_editor_files(self):
         """Save the content of both editors to their respective files."""
-        try:
-            # Save .ignore file
-            ignore_path = self.ignore_file_var.get()
-            # Convert to absolute path if it's relative
-            if not os.path.isabs(ignore_path):
-                ignore_path = os.path.join(project_root, ignore_path)
-            
-            with open(ignore_path, 'w', encoding='utf-8') as f:
-                f.write(self.ignore_editor.get(1.0, tk.END))
-            
-            # Save important_files.txt
-            important_files_path = self.important_files_entry.get()
-            # Convert to absolute path if it's relative
-            if not os.path.isabs(important_files_path):
-                important_files_path = os.path.join(project_root, important_files_path)
-            
-            with open(important_files_path, 'w', encoding='utf-8') as f:
-                f.write(self.important_files_editor.get(1.0, tk.END))
-            
-            messagebox.showinfo("Success", "Files saved successfully.")
-        except Exception as e:
-            messagebox.showerror("Error", f"Error saving files: {e}")
+        future = self._submit_editor_save()
+        if future is None:
+            return
+        
+        self._hand_back(
+            future,
+            lambda _: messagebox.showinfo("Success", "Files saved successfully."),
+            "Error saving files"
+        )
     
     def reload_editor_files(self):
         """Reload both editor files from disk."""
-        self.load_ignore_file()
-        self.load_important_files()
-        messagebox.showinfo("Success", "Files reloaded successfully.")
+        from src.utils.config import create_default_important_files
+        from src.utils.ignore import create_default_ignore
+        
+        # Read both files at the same time; the executor has a thread for each
+        futures = [
+            self._io_executor.submit(_read_text_file, self._ignore_file_path(), create_default_ignore),
+            self._io_executor.submit(
+                _read_text_file, self._important_files_list_path(), create_default_important_files
+            )
+        ]
+        self._begin_editor_io()
+        
+        def files_read():
+            # Runs on the Tk thread once both reads are done
+            try:
+                ignore_content, important_files_content = [f.result() for f in futures]
+            except Exception as e:
+                messagebox.showerror("Error", f"Error reloading files: {e}")
+                return
+            finally:
+                self._end_editor_io()
+            
+            self._set_editor_content(self.ignore_editor, ignore_content)
+            self._set_editor_content(self.important_files_editor, important_files_content)
+            messagebox.showinfo("Success", "Files reloaded successfully.")
+        
+        self._when_done(futures, files_read)
+    
+    def close(self):
+        """Stop the I/O thread and any running organizer, and close the window."""
+        if self._organizer_process is not None and self._organizer_process.poll() is None:
+            self._organizer_process.terminate()
+        
+        self._io_executor.shutdown(wait=False)
+        self.root.destroy()
     
     def browse_project_path(self):
         """Open directory browser for project path."""
         directory = filedialog.askdirectory(
-            initialdir=self.project_path_var.get() or os.path.expanduser("~"),
+            initialdir=self.project_path_var.get() or home_dir,
             title="Select Project Directory"
         )
         if directory:
@@ -470,7 +678,7 @@ class SettingsGUI:
     def browse_output_dir(self):
         """Open directory browser for output directory."""
         directory = filedialog.askdirectory(
-            initialdir=self.output_dir_var.get() or os.path.join(project_root, "output"),
+            initialdir=self.output_dir_var.get() or default_output_dir,
             title="Select Output Directory"
         )
         if directory:
@@ -485,18 +693,16 @@ class SettingsGUI:
         )
         if filename:
             self.ignore_file_var.set(filename)
-            # Also reload the file content in the editor
-            self.load_ignore_file()
+            # Also reload the file content in the editor, if it has been opened
+            if self._tab_built(self._file_editors_tab):
+                self.load_ignore_file()
     
     def browse_important_files(self):
         """Open file browser for important files list."""
         # Get initial directory - either the directory of the current value or project root
         current_value = self.important_files_entry.get()
         if current_value and os.path.dirname(current_value):
-            if os.path.isabs(current_value):
-                initial_dir = os.path.dirname(current_value)
-            else:
-                initial_dir = os.path.dirname(os.path.join(project_root, current_value))
+            initial_dir = os.path.dirname(_resolve_path(current_value))
         else:
             initial_dir = project_root
             
@@ -507,54 +713,68 @@ class SettingsGUI:
         )
         
         if filename:
-            # Convert to relative path if within project root
-            if filename.startswith(project_root):
-                rel_path = os.path.relpath(filename, project_root)
-                self.important_files_entry.delete(0, tk.END)
-                self.important_files_entry.insert(0, rel_path)
-            else:
-                # Use absolute path if outside project root
-                self.important_files_entry.delete(0, tk.END)
-                self.important_files_entry.insert(0, filename)
+            # Convert to relative path if within project root, else keep the absolute path
+            if filename.startswith(project_root_prefix):
+                filename = os.path.relpath(filename, project_root)
+            self._set_entry(self.important_files_entry, filename)
             
-            # Also reload the file content in the editor
-            self.load_important_files()
+            # Also reload the file content in the editor, if it has been opened
+            if self._tab_built(self._file_editors_tab):
+                self.load_important_files()
 
-    def get_text_content(self, text_widget):
-        """Get content from a Text widget."""
-        return text_widget.get("1.0", tk.END).strip()
+    def _snapshot_config(self):
+        """Copy the config's values, for comparing against later."""
+        return {section: dict(options) for section, options in self.config.items()}
+    
+    def _set_entry(self, entry, value):
+        """Replace the text in an entry widget."""
+        entry.delete(0, tk.END)
+        entry.insert(0, value)
     
     def save_settings(self):
         """Save settings to config file."""
         try:
-            # Update config object with current values
+            # Collect the current values per section, then update the config at once
             # General Settings
-            self.config['settings']['path'] = self.project_path_var.get()
-            self.config['settings']['output_dir'] = self.output_dir_var.get()
-            self.config['settings']['ignore'] = self.ignore_file_var.get()
-            
-            # Get value directly from entry widget
-            self.config['settings']['important_files_path'] = self.important_files_entry.get()
-            
-            self.config['settings']['max_tokens'] = self.max_tokens_var.get()
-            self.config['settings']['generate_structure'] = str(self.generate_structure_var.get())
-            self.config['settings']['generate_readme'] = str(self.generate_readme_var.get())
-            self.config['settings']['open_output_folder'] = str(self.open_output_var.get())
+            updates = {
+                'settings': {
+                    'path': self.project_path_var.get(),
+                    'output_dir': self.output_dir_var.get(),
+                    'ignore': self.ignore_file_var.get(),
+                    # Get value directly from entry widget
+                    'important_files_path': self.important_files_entry.get(),
+                    'max_tokens': self.max_tokens_var.get(),
+                    'generate_structure': str(self.generate_structure_var.get()),
+                    'generate_readme': str(self.generate_readme_var.get()),
+                    'open_output_folder': str(self.open_output_var.get())
+                },
+                'api_settings': {}
+            }
             
-            # File Importance Settings
-            self.config['file_importance']['important_formats'] = self.get_text_content(self.important_formats_text)
-            self.config['file_importance']['important_files'] = self.get_text_content(self.important_files_text)
-            self.config['file_importance']['important_paths'] = self.get_text_content(self.important_paths_text)
+            # File Importance Settings; a tab that was never opened keeps its values
+            if self._tab_built(self._importance_tab):
+                updates['file_importance'] = {
+                    'important_formats': self.important_formats_entry.get().strip(),
+                    'important_files': self.important_names_entry.get().strip(),
+                    'important_paths': self.important_paths_entry.get().strip()
+                }
             
             # API Settings
-            self.config['api_settings']['extract_endpoints'] = str(self.extract_endpoints_var.get())
+            if self._tab_built(self._api_tab):
+                updates['api_settings']['extract_endpoints'] = str(self.extract_endpoints_var.get())
             # We don't need to save an endpoint path anymore as it's automatically generated
-            if 'endpoint_path' in self.config['api_settings']:
-                self.config['api_settings']['endpoint_path'] = ''
+            if self.config.has_option('api_settings', 'endpoint_path'):
+                updates['api_settings']['endpoint_path'] = ''
             
-            # Save to file
-            with open(self.config_path, 'w') as configfile:
-                self.config.write(configfile)
+            self.config.read_dict(updates)
+            
+            # Leave the file, and its modification time, alone if nothing changed
+            current = self._snapshot_config()
+            if current != self._saved_config:
+                # Save to file, rendering the whole config first and writing it in one go
+                from src.utils.config import save_config
+                save_config(self.config_path, self.config)
+                self._saved_config = current
             
             messagebox.showinfo("Success", "Settings saved successfully.")
             return True
@@ -567,64 +787,96 @@ class SettingsGUI:
         output_dir = self.output_dir_var.get()
         if os.path.exists(output_dir):
             try:
-                if sys.platform == 'win32':
-                    os.startfile(output_dir)
-                elif sys.platform == 'darwin':  # macOS
-                    subprocess.call(['open', output_dir])
-                else:  # Linux
-                    subprocess.call(['xdg-open', output_dir])
+                _get_folder_opener()(output_dir)
             except Exception as e:
                 messagebox.showwarning("Warning", f"Could not open output folder: {e}")
     
     def run_organizer(self):
         """Save settings and run the organizer."""
-        # First save any changes in the editors
-        self.save_editor_files()
-        
+        # First save any changes in the editors; the organizer reads these
+        # files, so it is only started once they are written
+        future = self._submit_editor_save()
+        if future is None:
+            self._start_organizer()
+            return
+        
+        self._begin_editor_io()
+        self._hand_back(future, lambda _: None, "Error saving files", self._after_run_save)
+    
+    def _after_run_save(self):
+        """Re-enable saving and start the organizer once the editor files are written."""
+        self._end_editor_io()
+        self._start_organizer()
+    
+    def _start_organizer(self):
+        """Save the settings and start the organizer in a separate process."""
         if self.save_settings():
             try:
                 # Create a direct command to run the main script from the correct directory
                 import subprocess
                 
-                # Get the main.py script path
-                main_script = os.path.join(project_root, 'src', 'main.py')
-                
                 # Use the current Python executable
                 python_executable = sys.executable
                 
                 # Set the working directory to the project root
                 working_dir = project_root
                 
-                messagebox.showinfo("Running", "Starting the organizer...\nThis window will close.")
-                self.root.destroy()
-                
                 # Run the organizer with proper environment
-                process = subprocess.Popen(
-                    [python_executable, main_script],
+                self._organizer_process = subprocess.Popen(
+                    [python_executable, main_script_path],
                     cwd=working_dir,
-                    env=dict(os.environ, PYTHONPATH=working_dir)
+                    env=self._child_env
                 )
                 
-                # Wait for the process to complete
-                process.wait()
-                
-                # Open output folder if enabled
-                if self.config['settings'].getboolean('open_output_folder', True):
-                    output_dir = self.config['settings'].get('output_dir', 'output')
-                    if os.path.exists(output_dir):
-                        if sys.platform == 'win32':
-                            os.startfile(output_dir)
-                        elif sys.platform == 'darwin':  # macOS
-                            subprocess.call(['open', output_dir])
-                        else:  # Linux
-                            subprocess.call(['xdg-open', output_dir])
+                # Keep the window responsive while the organizer runs
+                self._show_running()
+                self.root.after(200, self._poll_organizer)
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Error running organizer: {e}")
+    
+    def _show_running(self):
+        """Replace the settings with a progress view while the organizer runs."""
+        self.main_frame.pack_forget()
+        
+        running_frame = ttk.Frame(self.root, padding="10")
+        running_frame.pack(fill=tk.BOTH, expand=True)
+        
+        ttk.Label(running_frame, text="Running organizer...").pack(pady=(40, 10))
+        
+        progress = ttk.Progressbar(running_frame, mode='indeterminate', length=300)
+        progress.pack(pady=10)
+        progress.start()
+        
+        cancel_button = ttk.Button(running_frame, text="Cancel", command=self._organizer_process.terminate)
+        cancel_button.pack(pady=10)
+    
+    def _poll_organizer(self):
+        """Check whether the organizer has finished, and look again later if not."""
+        returncode = self._organizer_process.poll()
+        if returncode is None:
+            self.root.after(200, self._poll_organizer)
+        else:
+            self._on_organizer_done(returncode)
+    
+    def _on_organizer_done(self, returncode):
+        """Open the output folder after a successful run and close the window."""
+        # Open output folder if enabled; a failed or cancelled run has nothing to show
+        if returncode == 0 and self.config['settings'].getboolean('open_output_folder', True):
+            output_dir = self.config['settings'].get('output_dir', 'output')
+            if os.path.exists(output_dir):
+                try:
+                    _get_folder_opener()(output_dir)
+                except Exception as e:
+                    messagebox.showwarning("Warning", f"Could not open output folder: {e}")
+        
+        self.close()
 
 
 def main():
     """Main function to run the settings GUI."""
+    _ensure_config_assets()
+    
     root = tk.Tk()
     app = SettingsGUI(root)
     root.mainloop()
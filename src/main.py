@@ -3,11 +3,9 @@
 Main entry point for the Claude AI File Organizer.
 """
 
-import json
 import os
 import sys
 import argparse
-import configparser
 import shutil
 import subprocess
 from pathlib import Path
@@ -20,12 +18,8 @@ if __name__ == "__main__":
 # Import local modules
 from utils.config import load_config
 from utils.logger import setup_logger, log_exception
-from core.file_scanner import scan_directory
-from core.token_counter import estimate_tokens
+from core.file_scanner import scan_directory, load_scan_cache, save_scan_cache
 from core.file_organizer import organize_files
-from core.structure_generator import generate_structure
-from core.readme_generator import generate_readme, save_readme
-from api.extract_endpoints import extract_endpoints_from_file, group_endpoints_by_prefix
 
 
 def parse_arguments():
@@ -85,12 +79,12 @@ def main():
     
     # Parse command line arguments
     args = parse_arguments()
-    logger.info(f"Command line arguments: {args}")
+    logger.info("Command line arguments: %s", args)
     
     # Load configuration
     try:
         config = load_config(args.config)
-        logger.info(f"Configuration loaded from {args.config}")
+        logger.info("Configuration loaded from %s", args.config)
     except Exception as e:
         log_exception(logger, e, "loading configuration")
         print(f"Error loading configuration: {e}")
@@ -99,10 +93,10 @@ def main():
     # Override configuration with command line arguments if provided
     if args.path:
         config['settings']['path'] = args.path
-        logger.info(f"Path overridden from command line: {args.path}")
+        logger.info("Path overridden from command line: %s", args.path)
     if args.max_tokens:
         config['settings']['max_tokens'] = str(args.max_tokens)
-        logger.info(f"Max tokens overridden from command line: {args.max_tokens}")
+        logger.info("Max tokens overridden from command line: %s", args.max_tokens)
     
     # Validate essential configuration
     project_path = config['settings'].get('path')
@@ -113,43 +107,45 @@ def main():
     
     # Ensure project path exists
     if not os.path.isdir(project_path):
-        logger.error(f"Project path does not exist: {project_path}")
+        logger.error("Project path does not exist: %s", project_path)
         print(f"Error: Project path does not exist: {project_path}")
         return 1
     
     print(f"Project path: {project_path}")
-    logger.info(f"Project path: {project_path}")
+    logger.info("Project path: %s", project_path)
     
-    # Create output directory if it doesn't exist
     output_dir = config['settings'].get('output_dir', 'output')
-    Path(output_dir).mkdir(exist_ok=True)
-    logger.info(f"Output directory: {output_dir}")
+    logger.info("Output directory: %s", output_dir)
     
     # Get project name from path
     project_name = os.path.basename(os.path.normpath(project_path))
     project_output_path = os.path.join(output_dir, project_name)
     
-    # Create project output directory if it doesn't exist
-    Path(project_output_path).mkdir(exist_ok=True)
+    # Create the output and project output directories in one call
+    Path(project_output_path).mkdir(parents=True, exist_ok=True)
     
     # Get maximum token limit
     max_tokens = int(config['settings'].get('max_tokens', '60000'))
     print(f"Maximum token limit: {max_tokens}")
-    logger.info(f"Maximum token limit: {max_tokens}")
+    logger.info("Maximum token limit: %s", max_tokens)
     
     # Store the most recent export folder path
     latest_export_folder = None
     
+    # Reuse text probes and token counts for files unchanged since the last run
+    scan_cache = load_scan_cache(project_output_path)
+    
     # Scan the directory for files
     try:
         print("Scanning directory for files...")
-        logger.info(f"Scanning directory: {project_path}")
+        logger.info("Scanning directory: %s", project_path)
         files_info = scan_directory(
             project_path, 
             config, 
-            Path(config['settings'].get('ignore', '.ignore'))
+            Path(config['settings'].get('ignore', '.ignore')),
+            cache=scan_cache
         )
-        logger.info(f"Found {len(files_info)} files")
+        logger.info("Found %d files", len(files_info))
     except Exception as e:
         log_exception(logger, e, "scanning directory")
         print(f"Error scanning directory: {e}")
@@ -163,11 +159,13 @@ def main():
             files_info, 
             max_tokens,
             config['settings'].getboolean('generate_structure', True),
-            config['settings'].getboolean('generate_readme', True)
+            config['settings'].getboolean('generate_readme', True),
+            cache=scan_cache
         )
         latest_export_folder = export_folder  # Store the export folder path
-        logger.info(f"Selected {len(organized_files)} files")
-        logger.info(f"Export folder: {export_folder}")
+        logger.info("Selected %d files", len(organized_files))
+        logger.info("Export folder: %s", export_folder)
+        save_scan_cache(project_output_path, scan_cache)
     except Exception as e:
         log_exception(logger, e, "organizing files")
         print(f"Error organizing files: {e}")
@@ -176,44 +174,51 @@ def main():
     # Extract API endpoints if enabled
     if config['api_settings'].getboolean('extract_endpoints', False):
         try:
+            # Endpoint extraction pulls in the spec parsers, so only import it when enabled
+            from api.extract_endpoints import (
+                ENDPOINT_EXTENSIONS, extract_endpoints_from_files, save_endpoints,
+                load_endpoint_cache, save_endpoint_cache
+            )
+            
             print("Extracting API endpoints...")
             logger.info("Extracting API endpoints...")
-            endpoints = []
+            # Deduplicate as results come in rather than in one pass at the end
+            endpoints = set()
             
-            # Extract endpoints from each file
-            for file_info in organized_files:
-                file_path = file_info['abs_path']
-                file_ext = os.path.splitext(file_path)[1].lower()
-                
-                # Only extract from relevant file types
-                if file_ext in ['.py', '.js', '.ts', '.java', '.rb', '.php', '.go', '.yaml', '.yml', '.json']:
-                    try:
-                        file_endpoints = extract_endpoints_from_file(file_path, file_info.get('content', ''))
-                        if file_endpoints:
-                            print(f"Found {len(file_endpoints)} endpoints in {file_info['path']}")
-                            logger.info(f"Found {len(file_endpoints)} endpoints in {file_info['path']}")
-                            endpoints.extend(file_endpoints)
-                    except Exception as e:
-                        logger.warning(f"Error extracting endpoints from {file_path}: {e}")
-                        print(f"Warning: Error extracting endpoints from {file_path}: {e}")
+            # Reuse results for files that have not changed since the last run
+            endpoint_cache = load_endpoint_cache(output_dir)
             
-            # Remove duplicates
-            unique_endpoints = list(set(endpoints))
+            # Only extract from relevant file types
+            relevant_files = {
+                file_info['abs_path']: file_info['path']
+                for file_info in organized_files
+                if os.path.splitext(file_info['abs_path'])[1].lower() in ENDPOINT_EXTENSIONS
+            }
             
-            if unique_endpoints:
-                print(f"Found {len(unique_endpoints)} unique endpoints.")
-                logger.info(f"Found {len(unique_endpoints)} unique endpoints.")
-                
-                # Group endpoints by prefix
-                grouped_endpoints = group_endpoints_by_prefix(unique_endpoints)
+            # Extract endpoints from each file, in parallel for larger projects
+            results = extract_endpoints_from_files(list(relevant_files), cache=endpoint_cache)
+            for file_path, file_endpoints, error in results:
+                if error:
+                    logger.warning("Error extracting endpoints from %s: %s", file_path, error)
+                    print(f"Warning: Error extracting endpoints from {file_path}: {error}")
+                elif file_endpoints:
+                    print(f"Found {len(file_endpoints)} endpoints in {relevant_files[file_path]}")
+                    logger.info("Found %d endpoints in %s", len(file_endpoints), relevant_files[file_path])
+                    endpoints.update(file_endpoints)
+            
+            save_endpoint_cache(output_dir, endpoint_cache)
+            
+            if endpoints:
+                print(f"Found {len(endpoints)} unique endpoints.")
+                logger.info("Found %d unique endpoints.", len(endpoints))
                 
-                # Save endpoints to JSON file in output directory
+                # Group endpoints by prefix (sorted so the file is the same from run
+                # to run) and save them to a JSON file in the output directory
                 endpoints_path = os.path.join(project_output_path, f"{project_name}_endpoints.json")
-                with open(endpoints_path, 'w', encoding='utf-8') as f:
-                    json.dump(grouped_endpoints, f, indent=2)
+                save_endpoints(sorted(endpoints), endpoints_path)
                 
                 print(f"Endpoints saved to {endpoints_path}")
-                logger.info(f"Endpoints saved to {endpoints_path}")
+                logger.info("Endpoints saved to %s", endpoints_path)
             else:
                 print("No API endpoints found.")
                 logger.info("No API endpoints found.")
@@ -0,0 +1,72 @@
+"""
+Persistent cache helpers for Claude AI File Organizer.
+"""
+
+import os
+import json
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=None)
+def ensure_dir(path):
+    """
+    Create a directory (and its parents) once per process.
+    
+    Repeated calls for the same path are answered from the cache without
+    touching the filesystem.
+    
+    Args:
+        path (str): Directory path
+    """
+    Path(path).mkdir(parents=True, exist_ok=True)
+
+
+def load_cache(cache_path):
+    """
+    Load a JSON cache file.
+    
+    Args:
+        cache_path (str): Path to the cache file
+        
+    Returns:
+        dict: Cached data, or an empty dict if the file is missing or unreadable
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (IOError, ValueError):
+        return {}
+    
+    return data if isinstance(data, dict) else {}
+
+
+def save_cache(cache_path, data):
+    """
+    Save data to a JSON cache file.
+    
+    The file is written to a temporary path first and then moved into place,
+    so an interrupted run never leaves a half-written cache behind.
+    
+    Args:
+        cache_path (str): Path to the cache file
+        data (dict): Data to cache
+        
+    Returns:
+        bool: True if the cache was saved, False otherwise
+    """
+    temp_path = cache_path + '.tmp'
+    
+    try:
+        cache_dir = os.path.dirname(cache_path)
+        if cache_dir:
+            ensure_dir(cache_dir)
+        
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(temp_path, cache_path)
+    except (IOError, TypeError, ValueError) as e:
+        print(f"Warning: Could not save cache to {cache_path}: {e}")
+        return False
+    
+    return True
@@ -3,34 +3,88 @@ Configuration handling for Claude AI File Organizer.
 """
 
 import os
-import configparser
 from pathlib import Path
 
+from src.utils import fast_ini
+from src.utils.ignore import PATTERN_LINE_RE
+
+
+# Parsed configs by absolute path, with the (mtime_ns, size) they were read at
+_CONFIG_CACHE = {}
+
+
+def _config_key(config_path):
+    """Get the cache key and the file's (mtime_ns, size) for a config path."""
+    config_stat = os.stat(config_path)
+    return os.path.abspath(config_path), (config_stat.st_mtime_ns, config_stat.st_size)
+
 
 def load_config(config_path='config.ini'):
     """
     Load configuration from config file.
     
+    A parsed config is reused until the file's modification time or size
+    changes, so loading the same file again skips parsing it. Each call
+    returns its own copy, so changing it never affects later loads.
+    
     Args:
         config_path (str): Path to the configuration file
         
     Returns:
-        configparser.ConfigParser: Configuration object
+        fast_ini.IniConfig: Configuration object, read like a ConfigParser
         
     Raises:
         FileNotFoundError: If the config file does not exist
-        configparser.Error: If there's an error parsing the config file
+        ValueError: If required configuration is missing
     """
-    if not os.path.exists(config_path):
-        raise FileNotFoundError(f"Config file not found: {config_path}")
+    # One stat both checks that the file exists and versions the cache entry
+    try:
+        cache_key, file_version = _config_key(config_path)
+    except OSError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+    
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[0] == file_version:
+        return cached[1].copy()
     
-    config = configparser.ConfigParser()
-    config.read(config_path)
+    config = fast_ini.read(config_path)
     
     # Validate required sections and settings
     validate_config(config)
     
-    return config
+    _CONFIG_CACHE[cache_key] = (file_version, config)
+    return config.copy()
+
+
+def cache_config(config_path, config):
+    """
+    Remember a config that was just written to a file, so loading it again skips parsing.
+    
+    Args:
+        config_path (str): Path the configuration was written to
+        config (fast_ini.IniConfig): Configuration object that was written
+    """
+    try:
+        cache_key, file_version = _config_key(config_path)
+    except OSError:
+        return
+    
+    _CONFIG_CACHE[cache_key] = (file_version, config.copy())
+
+
+def save_config(config_path, config):
+    """
+    Write a configuration to a file and remember it, so loading it again skips parsing.
+    
+    The file is written as UTF-8, the encoding load_config reads it with.
+    The cache is only updated once the write has succeeded.
+    
+    Args:
+        config_path (str): Path to the configuration file
+        config (fast_ini.IniConfig): Configuration object to write
+    """
+    Path(config_path).write_text(fast_ini.dump(config), encoding='utf-8')
+    cache_config(config_path, config)
 
 
 def validate_config(config):
@@ -38,7 +92,7 @@ def validate_config(config):
     Validate that all required configuration is present.
     
     Args:
-        config (configparser.ConfigParser): Configuration object
+        config (fast_ini.IniConfig): Configuration object
         
     Raises:
         ValueError: If required configuration is missing
@@ -95,18 +149,17 @@ def load_important_files(important_files_path='important_files.txt'):
     """
     patterns = []
     
-    # Create default if not exists
-    if not os.path.exists(important_files_path):
-        create_default_important_files(important_files_path)
-    
     try:
-        with open(important_files_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                # Skip comments and empty lines
-                if not line or line.startswith('#'):
-                    continue
-                patterns.append(line)
+        # Create default if not exists; opening the file is the existence check
+        try:
+            f = open(important_files_path, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            create_default_important_files(important_files_path)
+            f = open(important_files_path, 'r', encoding='utf-8')
+        
+        # Pattern lines, skipping comments and empty lines, in one regex pass
+        with f:
+            patterns = PATTERN_LINE_RE.findall(f.read())
     except Exception as e:
         print(f"Warning: Could not load important files from {important_files_path}: {e}")
     
@@ -123,9 +176,6 @@ def create_default_important_files(important_files_path='important_files.txt'):
     Returns:
         bool: True if file was created, False if it already exists
     """
-    if os.path.exists(important_files_path):
-        return False
-    
     default_content = """# Important Files for Claude AI File Organizer
 # One file pattern per line. These will be prioritized during organization.
 # Use glob patterns (e.g., *.py, src/*.md)
@@ -166,8 +216,12 @@ test_*.py
 *_test.py
 """
     
-    with open(important_files_path, 'w', encoding='utf-8') as f:
-        f.write(default_content)
+    # Exclusive mode doubles as the existence check
+    try:
+        with open(important_files_path, 'x', encoding='utf-8') as f:
+            f.write(default_content)
+    except FileExistsError:
+        return False
     
     return True
 
@@ -182,10 +236,7 @@ def create_default_config(config_path='config.ini'):
     Returns:
         bool: True if file was created, False if it already exists
     """
-    if os.path.exists(config_path):
-        return False
-    
-    config = configparser.ConfigParser()
+    config = fast_ini.IniConfig()
     
     # Default settings
     config['settings'] = {
@@ -211,8 +262,11 @@ def create_default_config(config_path='config.ini'):
         'endpoint_path': ''
     }
     
-    # Write the configuration to file
-    with open(config_path, 'w') as configfile:
-        config.write(configfile)
+    # Write the configuration to file; exclusive mode doubles as the existence check
+    try:
+        with open(config_path, 'x', encoding='utf-8') as configfile:
+            config.write(configfile)
+    except FileExistsError:
+        return False
     
     return True
\ No newline at end of file
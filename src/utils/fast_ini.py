@@ -0,0 +1,137 @@
+"""
+Lightweight INI reading and writing for Claude AI File Organizer.
+
+config.ini only holds [section] headers and key = value lines, so it is
+parsed with two regexes instead of configparser. Values are plain strings:
+there is no interpolation and no multi-line values.
+"""
+
+import re
+
+
+SECTION_RE = re.compile(r'^\[([^\]]+)\]\s*$', re.M)
+KV_RE = re.compile(r'^([^=\s;#][^=\n]*?)[ \t]*=[ \t]*(.*?)\s*$', re.M)
+
+# Strings accepted as booleans, as configparser accepts them
+BOOLEAN_STATES = {
+    '1': True, 'yes': True, 'true': True, 'on': True,
+    '0': False, 'no': False, 'false': False, 'off': False
+}
+
+
+class IniSection(dict):
+    """Options of one section, with the configparser-style getboolean lookup."""
+    
+    def getboolean(self, option, fallback=None):
+        """
+        Get an option as a boolean.
+        
+        Args:
+            option (str): Option name
+            fallback (bool, optional): Value returned if the option is missing
+            
+        Returns:
+            bool: Option value
+            
+        Raises:
+            ValueError: If the value is not a recognized boolean
+        """
+        if option not in self:
+            return fallback
+        
+        value = self[option]
+        try:
+            return BOOLEAN_STATES[value.lower()]
+        except KeyError:
+            raise ValueError(f"Not a boolean: {value}") from None
+
+
+class IniConfig(dict):
+    """Sections by name; assigned sections are stored as IniSection."""
+    
+    def __setitem__(self, section, options):
+        super().__setitem__(section, IniSection((key.lower(), str(value)) for key, value in options.items()))
+    
+    def has_option(self, section, option):
+        """Check whether a section exists and holds an option."""
+        return section in self and option in self[section]
+    
+    def read_dict(self, sections):
+        """
+        Update options from a dict of sections, creating missing sections.
+        
+        Args:
+            sections (dict): Option dicts by section name
+        """
+        for section, options in sections.items():
+            if section not in self:
+                self[section] = {}
+            self[section].update((key.lower(), str(value)) for key, value in options.items())
+    
+    def copy(self):
+        """Return a copy whose sections can be changed without affecting this config."""
+        config = IniConfig()
+        for section, options in self.items():
+            dict.__setitem__(config, section, IniSection(options))
+        return config
+    
+    def write(self, fileobj):
+        """Write the configuration in INI format to a text file object."""
+        fileobj.write(dump(self))
+
+
+def parse(text):
+    """
+    Parse INI text.
+    
+    Option names are lowercased, as configparser does. Lines before the
+    first section header, comments, indented lines and lines without an
+    '=' are ignored.
+    
+    Args:
+        text (str): INI file content
+        
+    Returns:
+        IniConfig: Parsed sections
+    """
+    config = IniConfig()
+    
+    # split() yields the text before the first header, then (name, body) pairs
+    parts = SECTION_RE.split(text)
+    for name, body in zip(parts[1::2], parts[2::2]):
+        name = name.strip()
+        if name not in config:
+            config[name] = {}
+        config[name].update((key.lower(), value) for key, value in KV_RE.findall(body))
+    
+    return config
+
+
+def dump(config):
+    """
+    Format sections as INI text, laid out the way configparser writes them.
+    
+    Args:
+        config (dict): Option dicts by section name
+        
+    Returns:
+        str: INI file content
+    """
+    return "".join(
+        f"[{section}]\n" + "".join(f"{key} = {value}\n" for key, value in options.items()) + "\n"
+        for section, options in config.items()
+    )
+
+
+def read(path):
+    """
+    Read and parse an INI file.
+    
+    Args:
+        path (str): Path to the file
+        
+    Returns:
+        IniConfig: Parsed sections
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse(f.read())
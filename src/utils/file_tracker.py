@@ -3,10 +3,19 @@ File tracking functionality for Claude AI File Organizer.
 """
 
 import os
-import json
-import datetime
+import time
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
+from src.utils.cache import ensure_dir
+
+# orjson is optional; it encodes large reports much faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def generate_file_report(project_name, project_path, selected_files, excluded_files, output_dir):
     """
@@ -24,81 +33,91 @@ def generate_file_report(project_name, project_path, selected_files, excluded_fi
     """
     report = {
         "project_name": project_name,
-        "report_date": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "report_date": time.strftime("%Y-%m-%d %H:%M:%S"),
         "total_files_analyzed": len(selected_files) + len(excluded_files),
         "selected_files_count": len(selected_files),
         "excluded_files_count": len(excluded_files),
-        "selected_files": [],
-        "excluded_files": []
+        # Selected files information
+        "selected_files": [
+            {
+                "path": file_info["path"],
+                "importance": file_info["importance"],
+                "tokens": file_info.get("tokens", 0),
+                "size": file_info.get("size", 0)
+            }
+            for file_info in selected_files
+        ],
+        # Excluded files information
+        "excluded_files": [
+            {
+                "path": file_info["path"],
+                "importance": file_info["importance"],
+                "size": file_info.get("size", 0),
+                "reason": file_info.get("reason", "Token limit exceeded or low importance")
+            }
+            for file_info in excluded_files
+        ]
     }
     
-    # Add selected files information
-    for file_info in selected_files:
-        report["selected_files"].append({
-            "path": file_info["path"],
-            "importance": file_info["importance"],
-            "tokens": file_info.get("tokens", 0),
-            "size": file_info.get("size", 0)
-        })
-    
-    # Add excluded files information
-    for file_info in excluded_files:
-        report["excluded_files"].append({
-            "path": file_info["path"],
-            "importance": file_info["importance"],
-            "size": file_info.get("size", 0),
-            "reason": file_info.get("reason", "Token limit exceeded or low importance")
-        })
+    # Create output directory if it doesn't exist (once per process)
+    ensure_dir(output_dir)
     
-    # Create output directory if it doesn't exist
-    Path(output_dir).mkdir(exist_ok=True)
+    # Both reports share the same path stem, joined once
+    report_stem = os.path.join(output_dir, f"{project_name}_file_report")
     
     # Save report to JSON file in the project directory
-    report_path = os.path.join(output_dir, f"{project_name}_file_report.json")
-    with open(report_path, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2)
+    report_path = f"{report_stem}.json"
+    if orjson is not None:
+        Path(report_path).write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        import json
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(report, indent=2))
+    
+    text_report_path = f"{report_stem}.txt"
+    lines = [
+        "Claude AI File Organizer Report\n",
+        "==============================\n\n",
+        f"Project: {project_name}\n",
+        f"Report Date: {report['report_date']}\n",
+        f"Total Files Analyzed: {report['total_files_analyzed']}\n",
+        f"Selected Files: {report['selected_files_count']}\n",
+        f"Excluded Files: {report['excluded_files_count']}\n\n",
+        "Selected Files:\n",
+        "---------------\n"
+    ]
+    
+    # Write selected files grouped by importance, highest first; the sort is
+    # stable, so files keep their order within a level. Entry lines are built
+    # with itemgetter and a fixed format rather than per-field lookups
+    selected_fields = itemgetter("path", "tokens")
+    for importance, group in _group_by_importance(report["selected_files"]):
+        lines.append(f"\nImportance Level: {importance}\n")
+        lines.extend("  - %s (%s tokens)\n" % selected_fields(file_info) for file_info in group)
     
-    # Create a more readable text version in the project directory
-    text_report_path = os.path.join(output_dir, f"{project_name}_file_report.txt")
+    lines.append("\nExcluded Files:\n")
+    lines.append("--------------\n")
+    # Write excluded files grouped by importance the same way
+    for importance, group in _group_by_importance(report["excluded_files"]):
+        lines.append(f"\nImportance Level: {importance}\n")
+        lines.extend("  - %s\n" % file_info["path"] for file_info in group)
+    
+    # Create a more readable text version in the project directory, written at once
     with open(text_report_path, 'w', encoding='utf-8') as f:
-        f.write(f"Claude AI File Organizer Report\n")
-        f.write(f"==============================\n\n")
-        f.write(f"Project: {project_name}\n")
-        f.write(f"Report Date: {report['report_date']}\n")
-        f.write(f"Total Files Analyzed: {report['total_files_analyzed']}\n")
-        f.write(f"Selected Files: {report['selected_files_count']}\n")
-        f.write(f"Excluded Files: {report['excluded_files_count']}\n\n")
-        
-        f.write(f"Selected Files:\n")
-        f.write(f"---------------\n")
-        # Group selected files by importance
-        importance_groups = {}
-        for file_info in report["selected_files"]:
-            importance = file_info["importance"]
-            if importance not in importance_groups:
-                importance_groups[importance] = []
-            importance_groups[importance].append(file_info)
-        
-        # Write files sorted by importance
-        for importance in sorted(importance_groups.keys(), reverse=True):
-            f.write(f"\nImportance Level: {importance}\n")
-            for file_info in importance_groups[importance]:
-                f.write(f"  - {file_info['path']} ({file_info['tokens']} tokens)\n")
-        
-        f.write(f"\nExcluded Files:\n")
-        f.write(f"--------------\n")
-        # Group excluded files by importance
-        importance_groups = {}
-        for file_info in report["excluded_files"]:
-            importance = file_info["importance"]
-            if importance not in importance_groups:
-                importance_groups[importance] = []
-            importance_groups[importance].append(file_info)
-        
-        # Write files sorted by importance
-        for importance in sorted(importance_groups.keys(), reverse=True):
-            f.write(f"\nImportance Level: {importance}\n")
-            for file_info in importance_groups[importance]:
-                f.write(f"  - {file_info['path']}\n")
+        f.write(''.join(lines))
+    
+    return text_report_path
+
+
+def _group_by_importance(files):
+    """
+    Group file entries by importance, highest importance first.
     
-    return text_report_path
\ No newline at end of file
+    Args:
+        files (list): Report entries with an 'importance' key
+        
+    Returns:
+        groupby: (importance, entries) pairs
+    """
+    by_importance = itemgetter("importance")
+    return groupby(sorted(files, key=by_importance, reverse=True), key=by_importance)
@@ -2,10 +2,14 @@
 Ignore file handling for Claude AI File Organizer.
 """
 
-import os
+import re
 from pathlib import Path
 
 
+# A pattern line: not blank and not a comment; captures it without surrounding whitespace
+PATTERN_LINE_RE = re.compile(r'^[^\S\n]*([^#\s][^\n]*?)\s*?$', re.M)
+
+
 def create_default_ignore(ignore_path='.ignore'):
     """
     Create a default .ignore file if it doesn't exist.
@@ -16,9 +20,6 @@ def create_default_ignore(ignore_path='.ignore'):
     Returns:
         bool: True if file was created, False if it already exists
     """
-    if os.path.exists(ignore_path):
-        return False
-    
     default_ignore = """# Directories to exclude (must end with '/')
 .git/
 .idea/
@@ -85,12 +86,36 @@ config.local.js
 *.rar
 """
     
-    with open(ignore_path, 'w', encoding='utf-8') as f:
-        f.write(default_ignore)
+    # Exclusive mode doubles as the existence check
+    try:
+        with open(ignore_path, 'x', encoding='utf-8') as f:
+            f.write(default_ignore)
+    except FileExistsError:
+        return False
     
     return True
 
 
+def read_ignore_patterns(ignore_path):
+    """
+    Read the patterns from an ignore file, skipping comments and empty lines.
+    
+    The whole file is read at once and scanned with a single regex rather
+    than stripped and checked line by line.
+    
+    Args:
+        ignore_path (str): Path to the ignore file
+        
+    Returns:
+        list: Patterns in file order
+        
+    Raises:
+        FileNotFoundError: If the ignore file does not exist
+    """
+    with open(ignore_path, 'r', encoding='utf-8') as f:
+        return PATTERN_LINE_RE.findall(f.read())
+
+
 def parse_ignore_file(ignore_path):
     """
     Parse an ignore file and return patterns.
@@ -104,22 +129,18 @@ def parse_ignore_file(ignore_path):
     dir_patterns = []
     file_patterns = []
     
-    # Create default ignore file if it doesn't exist
-    if not os.path.exists(ignore_path):
+    # Create default ignore file if it doesn't exist; reading it is the existence check
+    try:
+        patterns = read_ignore_patterns(ignore_path)
+    except FileNotFoundError:
         create_default_ignore(ignore_path)
+        patterns = read_ignore_patterns(ignore_path)
     
-    with open(ignore_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            
-            # Skip comments and empty lines
-            if not line or line.startswith('#'):
-                continue
-                
-            # Separate directory and file patterns
-            if line.endswith('/'):
-                dir_patterns.append(line[:-1])  # Remove trailing slash
-            else:
-                file_patterns.append(line)
+    for pattern in patterns:
+        # Separate directory and file patterns
+        if pattern.endswith('/'):
+            dir_patterns.append(pattern[:-1])  # Remove trailing slash
+        else:
+            file_patterns.append(pattern)
     
     return dir_patterns, file_patterns
\ No newline at end of file
@@ -3,8 +3,11 @@ Logging functionality for Claude AI File Organizer.
 """
 
 import os
+import time
+import queue
+import atexit
 import logging
-import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 
@@ -12,6 +15,11 @@ def setup_logger(log_dir="logs", log_level=logging.INFO):
     """
     Set up logging for the application.
     
+    Handlers are only added on the first call; later calls just update the
+    level, so log lines are not emitted once per call. The log file is
+    written by a background thread, so logging calls do not wait on disk
+    I/O; console output stays synchronous to keep its order with print().
+    
     Args:
         log_dir (str): Directory to store log files
         log_level (int): Logging level (e.g., logging.INFO, logging.DEBUG)
@@ -19,21 +27,29 @@ def setup_logger(log_dir="logs", log_level=logging.INFO):
     Returns:
         logging.Logger: Configured logger
     """
+    logger = logging.getLogger("claude_ai_file_organizer")
+    
+    # Already set up: reuse the handlers instead of stacking new ones
+    if logger.handlers:
+        logger.setLevel(log_level)
+        for handler in logger.handlers:
+            handler.setLevel(log_level)
+        return logger
+    
     # Create logs directory if it doesn't exist
     log_path = Path(log_dir)
     log_path.mkdir(exist_ok=True)
     
     # Generate log filename with timestamp
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     log_file = log_path / f"organizer_{timestamp}.log"
     
-    # Configure logger
-    logger = logging.getLogger("claude_ai_file_organizer")
+    # Configure logger; its own handlers do the output, so don't pass records on to the root logger
     logger.setLevel(log_level)
+    logger.propagate = False
     
-    # Create file handler
+    # Create file handler; the queue handler in front of it filters by level
     file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(log_level)
     
     # Create console handler
     console_handler = logging.StreamHandler()
@@ -44,8 +60,17 @@ def setup_logger(log_dir="logs", log_level=logging.INFO):
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
+    # Records for the file go through a queue to a listener thread, stopped
+    # (and the queue drained) at exit
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setLevel(log_level)
+    listener = QueueListener(log_queue, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
     # Add handlers to logger
-    logger.addHandler(file_handler)
+    logger.addHandler(queue_handler)
     logger.addHandler(console_handler)
     
     logger.info(f"Logging initialized. Log file: {log_file}")
@@ -61,7 +86,11 @@ def log_exception(logger, e, context=""):
         e (Exception): Exception to log
         context (str): Context description where the exception occurred
     """
+    # Skip building the message and traceback if errors are not being logged
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+    
     if context:
-        logger.error(f"Error in {context}: {str(e)}", exc_info=True)
+        logger.error("Error in %s: %s", context, e, exc_info=True)
     else:
-        logger.error(f"Error: {str(e)}", exc_info=True)
\ No newline at end of file
+        logger.error("Error: %s", e, exc_info=True)
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""
+Tests for configuration handling.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils import fast_ini
+from src.utils.config import create_default_config, load_config, save_config
+
+
+class TestConfig(unittest.TestCase):
+    """Tests for reading and writing config.ini."""
+
+    def test_non_ascii_round_trip(self):
+        """Test that a config with non-ASCII values loads back as it was saved."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = os.path.join(temp_dir, 'config.ini')
+            self.assertTrue(create_default_config(config_path))
+            self.assertFalse(create_default_config(config_path))
+            
+            config = load_config(config_path)
+            config.read_dict({'settings': {'path': 'C:/Users/Jürgen/项目', 'output_dir': 'ausgabe_ü'}})
+            save_config(config_path, config)
+            
+            # Parse the file itself; load_config would answer from its cache
+            config = fast_ini.read(config_path)
+            self.assertEqual(config['settings']['path'], 'C:/Users/Jürgen/项目')
+            self.assertEqual(config['settings']['output_dir'], 'ausgabe_ü')
+
+    def test_overrides_do_not_change_cached_config(self):
+        """Test that overriding a loaded setting, as main() does, leaves later loads alone."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = os.path.join(temp_dir, 'config.ini')
+            create_default_config(config_path)
+            
+            config = load_config(config_path)
+            saved_max_tokens = config['settings']['max_tokens']
+            config['settings']['max_tokens'] = '1'
+            
+            self.assertEqual(load_config(config_path)['settings']['max_tokens'], saved_max_tokens)
+    
+    def test_failed_save_keeps_cached_config(self):
+        """Test that settings which could not be written are not served by load_config."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = os.path.join(temp_dir, 'config.ini')
+            create_default_config(config_path)
+            
+            config = load_config(config_path)
+            saved_path = config['settings']['path']
+            config.read_dict({'settings': {'path': 'unsaved'}})
+            
+            with mock.patch('pathlib.Path.write_text', side_effect=OSError("disk full")):
+                with self.assertRaises(OSError):
+                    save_config(config_path, config)
+            
+            self.assertEqual(load_config(config_path)['settings']['path'], saved_path)
+    
+    def test_line_without_equals_is_skipped(self):
+        """Test that a stray line is not merged into the next option's name."""
+        config = fast_ini.parse('[settings]\nfoo\nbar = 1\nbaz\n= 2\n')
+        
+        self.assertEqual(config['settings'], {'bar': '1'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,194 @@
+"""
+Tests for API endpoint extraction functionality.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.api.extract_endpoints import (
+    extract_from_flask,
+    extract_flask_endpoints_ast,
+    extract_from_python,
+    extract_from_javascript,
+    extract_from_java,
+    extract_from_ruby,
+    extract_from_php,
+    extract_from_go,
+    extract_from_api_spec,
+    extract_generic_urls,
+    extract_endpoints_from_file,
+    load_endpoint_cache,
+    save_endpoint_cache,
+    clean_endpoint,
+    group_endpoints_by_prefix
+)
+
+
+class TestExtractEndpoints(unittest.TestCase):
+    """Tests for the endpoint extraction functionality."""
+
+    def test_extract_from_flask(self):
+        """Test Flask route extraction."""
+        content = (
+            b"@app.route('/users/')\n"
+            b"def users(): pass\n"
+            b"@bp.post(\"/login\")\n"
+            b"def login(): pass\n"
+            b"api.add_resource(Item, '/items/<int:id>')\n"
+            b"@ns.route('/health?verbose=1')\n"
+        )
+        endpoints = set(extract_from_flask(content))
+
+        self.assertIn('/users', endpoints)
+        self.assertIn('/items/<int:id>', endpoints)
+        self.assertIn('/health', endpoints)
+
+    def test_extract_from_flask_ast(self):
+        """Test that decorators missed by the regexes are found via the AST."""
+        content = (
+            b"@bp.post(\n"
+            b"    '/login'\n"
+            b")\n"
+            b"def login():\n"
+            b"    pass\n"
+        )
+        self.assertIn('/login', set(extract_from_flask(content)))
+
+    def test_extract_from_flask_blueprint_methods(self):
+        """Test that method decorators on any blueprint are matched by the regex."""
+        content = (
+            b"@app.route('/users')\n"
+            b"def users(): pass\n"
+            b"@bp.post('/login')\n"
+            b"def login(): pass\n"
+        )
+        self.assertEqual(set(extract_from_flask(content)), {'/users', '/login'})
+
+    def test_extract_from_flask_ast_nested_blocks(self):
+        """Test that the AST pass finds routes inside if/try/with blocks."""
+        content = (
+            b"def create_app():\n"
+            b"    if DEBUG:\n"
+            b"        @bp.post('/debug')\n"
+            b"        def debug(): pass\n"
+            b"    try:\n"
+            b"        pass\n"
+            b"    except ImportError:\n"
+            b"        @bp.put('/fallback')\n"
+            b"        def fallback(): pass\n"
+            b"    finally:\n"
+            b"        with ctx:\n"
+            b"            @bp.delete('/cleanup')\n"
+            b"            def cleanup(): pass\n"
+        )
+        self.assertEqual(set(extract_flask_endpoints_ast(content)), {'/debug', '/fallback', '/cleanup'})
+
+    def test_extract_from_python(self):
+        """Test FastAPI and Django extraction."""
+        content = (
+            b"@router.get('/items')\n"
+            b"urlpatterns = [path('admin/', admin.site.urls), url('^blog/', view)]\n"
+        )
+        endpoints = set(extract_from_python(content))
+
+        self.assertEqual(endpoints, {'/items', '/admin', '/blog'})
+
+    def test_extract_from_javascript(self):
+        """Test Express, React Router and HTTP client extraction."""
+        content = (
+            b"router.post('/api/login', handler);\n"
+            b"<Route exact path=\"/dashboard\" component={Dash} />\n"
+            b"fetch('https://example.com/api/data?x=1');\n"
+            b"axios({ url: '/api/other' });\n"
+        )
+        endpoints = set(extract_from_javascript(content))
+
+        self.assertEqual(endpoints, {'/api/login', '/dashboard', '/api/data', '/api/other'})
+
+    def test_extract_from_java(self):
+        """Test Spring and JAX-RS extraction."""
+        content = (
+            b'@RequestMapping("/api")\n'
+            b'@GetMapping("/users/{id}")\n'
+            b'@Path("orders")\n'
+        )
+        endpoints = set(extract_from_java(content))
+
+        self.assertEqual(endpoints, {'/api', '/users/{id}', '/orders'})
+
+    def test_extract_from_other_languages(self):
+        """Test Ruby, PHP and Go extraction."""
+        self.assertEqual(set(extract_from_ruby(b"get '/photos'\nmatch 'about'")), {'/photos', '/about'})
+        self.assertEqual(set(extract_from_php(b"Route::get('/users', 'C@i');")), {'/users'})
+        self.assertEqual(
+            set(extract_from_go(b'r.GET("/ping", h)\nhttp.HandleFunc("/health", h)')),
+            {'/ping', '/health'}
+        )
+
+    def test_extract_from_api_spec(self):
+        """Test OpenAPI specification extraction."""
+        content = b'{"openapi": "3.0.0", "paths": {"/pets": {}, "/pets/{id}/": {}}}'
+        endpoints = set(extract_from_api_spec('spec.json', content))
+
+        self.assertEqual(endpoints, {'/pets', '/pets/{id}'})
+
+    def test_extract_generic_urls(self):
+        """Test generic URL extraction."""
+        content = b'base = "https://example.com/api/users"\nother = "/rest/items"'
+        endpoints = set(extract_generic_urls(content))
+
+        self.assertIn('/api/users', endpoints)
+        self.assertIn('/rest/items', endpoints)
+
+    def test_no_endpoints(self):
+        """Test that plain source code yields no endpoints."""
+        content = b"def add(a, b):\n    return a + b\n"
+
+        self.assertEqual(list(extract_from_flask(content)), [])
+        self.assertEqual(list(extract_from_python(content)), [])
+
+    def test_clean_endpoint(self):
+        """Test endpoint normalization."""
+        self.assertEqual(clean_endpoint('users/'), '/users')
+        self.assertEqual(clean_endpoint('/search?q=1'), '/search')
+        self.assertEqual(clean_endpoint('/'), '')
+
+    def test_group_endpoints_by_prefix(self):
+        """Test grouping endpoints by their first path segment."""
+        groups = group_endpoints_by_prefix(['/api/users', '/api/items', '/health'])
+
+        self.assertEqual(sorted(groups['api']), ['/api/items', '/api/users'])
+        self.assertEqual(groups['health'], ['/health'])
+
+    def test_endpoint_cache(self):
+        """Test that cached results are reused and refreshed when a file changes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'routes.go')
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write('r.GET("/ping", h)\n')
+            
+            cache = load_endpoint_cache(temp_dir)
+            self.assertEqual(extract_endpoints_from_file(file_path, cache=cache), {'/ping'})
+            save_endpoint_cache(temp_dir, cache)
+            
+            cache = load_endpoint_cache(temp_dir)
+            self.assertIn(os.path.abspath(file_path), cache['files'])
+            self.assertEqual(extract_endpoints_from_file(file_path, cache=cache), {'/ping'})
+            
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write('r.GET("/ping", h)\nr.POST("/login", h)\n')
+            os.utime(file_path, ns=(0, 0))
+            
+            self.assertEqual(
+                set(extract_endpoints_from_file(file_path, cache=cache)),
+                {'/ping', '/login'}
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,8 +2,10 @@
 Tests for token counter functionality.
 """
 
+import io
 import os
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -14,30 +16,35 @@ from src.core.token_counter import (
     estimate_tokens,
     estimate_tokens_simple,
     estimate_file_tokens,
+    estimate_many_file_tokens,
     estimate_filename_tokens,
-    estimate_structure_tokens
+    estimate_structure_tokens,
+    _estimate_stream_tokens
 )
 
 
 class TestTokenCounter(unittest.TestCase):
     """Tests for the token counter functionality."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.test_dir = os.path.dirname(os.path.abspath(__file__))
+    @classmethod
+    def setUpClass(cls):
+        """Set up test environment once; no test modifies the test file."""
+        # A private directory, so parallel test runs never share files
+        cls._temp_dir = tempfile.TemporaryDirectory()
+        cls.test_dir = cls._temp_dir.name
         
         # Create test file
-        self.test_file = os.path.join(self.test_dir, 'test_content.txt')
-        with open(self.test_file, 'w', encoding='utf-8') as f:
+        cls.test_file = os.path.join(cls.test_dir, 'test_content.txt')
+        with open(cls.test_file, 'w', encoding='utf-8') as f:
             f.write('This is a test file with some content for token counting.\n')
             f.write('It has multiple lines and some punctuation!\n')
             f.write('Testing 1, 2, 3...')
     
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up after tests."""
-        # Remove test file
-        if os.path.exists(self.test_file):
-            os.remove(self.test_file)
+        # Remove the test directory and everything in it
+        cls._temp_dir.cleanup()
     
     def test_estimate_tokens_simple(self):
         """Test simple token estimation."""
@@ -62,6 +69,28 @@ class TestTokenCounter(unittest.TestCase):
         # File should have more than 10 tokens
         self.assertGreater(tokens, 10)
     
+    def test_estimate_stream_tokens(self):
+        """Test that reading an in-memory file gives the same count as the file on disk."""
+        with open(self.test_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        self.assertEqual(_estimate_stream_tokens(io.StringIO(content)), estimate_file_tokens(self.test_file))
+    
+    def test_estimate_stream_tokens_across_chunks(self):
+        """Test that text spanning several chunks is counted as if read at once."""
+        from src.core.token_counter import TOKEN_CHUNK_SIZE
+        
+        for content in ("first line\n    indented line\n\n" * (TOKEN_CHUNK_SIZE // 8), "x" * (3 * TOKEN_CHUNK_SIZE)):
+            self.assertEqual(_estimate_stream_tokens(io.StringIO(content)), estimate_tokens(content))
+    
+    def test_estimate_many_file_tokens(self):
+        """Test estimating tokens for several files at once."""
+        missing_file = "nonexistent_file.txt"
+        token_counts = estimate_many_file_tokens([self.test_file, missing_file])
+        
+        self.assertEqual(token_counts[self.test_file], estimate_file_tokens(self.test_file))
+        self.assertEqual(token_counts[missing_file], 0)
+    
     def test_estimate_nonexistent_file(self):
         """Test estimation for nonexistent file."""
         tokens = estimate_file_tokens('nonexistent_file.txt')
@@ -69,6 +98,17 @@ class TestTokenCounter(unittest.TestCase):
         # Should return 0 for nonexistent file
         self.assertEqual(tokens, 0)
     
+    def test_estimate_large_file_tokens(self):
+        """Test that chunked file estimation stays close to estimating the whole content."""
+        large_file = os.path.join(self.test_dir, 'test_large_content.txt')
+        content = 'def func_{0}(arg):\n    return arg * {0}  # ``` comment!\n' * 5000
+        
+        with open(large_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+        
+        # Per-chunk rounding may shift the total by about one token per chunk
+        self.assertAlmostEqual(estimate_file_tokens(large_file), estimate_tokens(content), delta=10)
+    
     def test_estimate_filename_tokens(self):
         """Test filename token estimation."""
         filename = "test_file_with_long_name.py"